@@ -12,11 +12,9 @@ from app.config import settings
 
 # Database dependency
 async def get_db() -> AsyncSession:
+    """요청당 하나의 세션 (FastAPI가 요청 내 의존성 결과를 캐시하므로 인증과 엔드포인트가 같은 세션 공유)"""
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 def get_settings():
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.v1.endpoints import problems, analysis, users, ranking, guide, auth, admin
+from app.schemas.common import prebuild_response_models
 
 api_router = APIRouter()
 
@@ -15,4 +16,7 @@ api_router.include_router(analysis.router, prefix="/analysis", tags=["analysis"]
 api_router.include_router(ranking.router, prefix="/ranking", tags=["ranking"])
 
 # Admin routes (Phase 2.2)
-api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
\ No newline at end of file
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+
+# 모든 APIResponse[...] 파라미터화 모델의 스키마를 첫 요청 전에 생성
+prebuild_response_models(api_router.routes)
@@ -13,6 +13,7 @@ from app.core.background_tasks import background_task_queue
 from app.core.scheduler import background_scheduler
 from app.services.profile_monitoring_service import profile_monitoring_service
 from app.services.enhanced_profile_service import enhanced_profile_service
+from app.services.database_service import DatabaseService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -336,4 +337,21 @@ async def cleanup_profile_cache(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="프로필 캐시 정리에 실패했습니다."
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/diagnostics/activity-query-plans")
+async def get_activity_query_plans(
+    username: str,
+    admin_user: User = Depends(get_admin_user)
+):
+    """user_activities 주요 쿼리의 실행 계획 (EXPLAIN ANALYZE) 조회"""
+    try:
+        return await DatabaseService().explain_activity_queries(username)
+
+    except Exception as e:
+        logger.error(f"쿼리 실행 계획 조회 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="쿼리 실행 계획 조회에 실패했습니다."
+        )
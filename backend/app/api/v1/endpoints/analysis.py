@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from app.services.analysis_service import AnalysisService
 from app.services.guide_service import GuideService
@@ -158,6 +159,30 @@ async def get_optimized_code(
         logger.error(f"Error generating optimized code: {str(e)}")
         raise HTTPException(status_code=500, detail="최적화 코드 생성 중 오류가 발생했습니다.")
 
+@router.post("/optimize/stream")
+async def stream_optimized_code(
+    request: OptimizedCodeRequest,
+    service: AnalysisService = Depends(get_analysis_service)
+):
+    """
+    AI 최적 코드 생성 (스트리밍)
+    생성되는 코드와 설명을 마크다운 텍스트로 순차 전송합니다.
+    """
+    logger.info(f"Streaming optimized code for problem {request.problem_id}")
+
+    async def generate():
+        try:
+            async for chunk in service.stream_optimized_code(
+                problem_id=request.problem_id,
+                language=request.language
+            ):
+                yield chunk
+        except Exception as e:
+            # 스트리밍 시작 후에는 상태 코드를 바꿀 수 없으므로 로그만 남기고 종료
+            logger.error(f"Error streaming optimized code: {str(e)}")
+
+    return StreamingResponse(generate(), media_type="text/markdown; charset=utf-8")
+
 @router.get("/history/{username}", response_model=APIResponse[FeedbackSummaryResponse])
 async def get_analysis_history(
     username: str,
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,7 +8,7 @@ from app.schemas.auth import (
     GoogleTokenRequest, GoogleTokenResponse, TokenResponse,
     UserProfile, LogoutResponse, AuthResponse, CurrentUser,
     ProfileVerificationRequest, ProfileVerificationResponse,
-    ProfileVerificationStatus, ProfileVerificationCheck
+    ProfileVerificationStatus, ProfileVerificationCheck, SessionInfo
 )
 from app.services.auth_service import auth_service
 from app.services.profile_verification_service import profile_verification_service
@@ -228,6 +228,45 @@ async def refresh_access_token(
         )
 
 
+@router.get("/sessions", response_model=List[SessionInfo])
+async def list_sessions(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    현재 사용자의 활성 세션 목록 조회
+    """
+    try:
+        user = await auth_service.get_user_with_sessions(db, current_user.user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다."
+            )
+
+        return [
+            SessionInfo(
+                session_id=session.session_id,
+                user_id=session.user_id,
+                expires_at=session.expires_at,
+                last_accessed=session.last_accessed,
+                user_agent=session.user_agent,
+                ip_address=str(session.ip_address) if session.ip_address else None,
+                created_at=session.created_at
+            )
+            for session in sorted(user.sessions_ro, key=lambda s: s.last_accessed, reverse=True)
+        ]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"세션 목록 조회 중 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="세션 목록 조회 중 오류가 발생했습니다."
+        )
+
+
 @router.delete("/sessions", response_model=AuthResponse)
 async def revoke_all_sessions(
     current_user: User = Depends(get_current_user),
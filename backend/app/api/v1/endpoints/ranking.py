@@ -1,5 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+
+from app.api.deps import get_db
 
 from app.services.database_service import DatabaseService
 from app.services.solvedac_service import SolvedACService
@@ -25,11 +30,11 @@ ranking_endpoints = RankingEndpoints()
 
 
 @router.get("/global", response_model=APIResponse[GlobalRankingResponse])
-async def get_global_ranking(limit: int = 100):
+async def get_global_ranking(limit: int = 100, db: AsyncSession = Depends(get_db)):
     """전체 랭킹 조회 (실시간 solved.ac API 데이터 사용 + DB 자동 동기화)"""
     try:
         # DB에서 인증된 사용자 목록과 CAU 해결 문제 수 조회
-        db_rankings = await ranking_endpoints.db_service.get_global_ranking(limit)
+        db_rankings = await ranking_endpoints.db_service.get_global_ranking(db, limit)
 
         # 각 사용자의 실시간 solved.ac 정보 조회 및 병합
         rankings = []
@@ -40,6 +45,7 @@ async def get_global_ranking(limit: int = 100):
 
                 # DB 프로필 정보 동기화 (백그라운드로 실행, 에러 무시)
                 await ranking_endpoints.db_service.update_user_solvedac_profile(
+                    db,
                     username=db_user["username"],
                     tier=solvedac_user.get("tier_name", "Unrated"),
                     rating=solvedac_user.get("rating", 0),
@@ -84,12 +90,31 @@ async def get_global_ranking(limit: int = 100):
         raise HTTPException(status_code=500, detail="전체 랭킹 조회 중 오류가 발생했습니다")
 
 
+
+@router.get("/global/export")
+async def export_global_ranking(
+    limit: int = Query(10000, ge=1, le=50000, description="내보낼 최대 사용자 수"),
+    db: AsyncSession = Depends(get_db)
+):
+    """전체 랭킹 내보내기 (DB 기준, 한 사용자당 한 줄의 NDJSON으로 스트리밍)"""
+
+    async def generate():
+        try:
+            async for entry in ranking_endpoints.db_service.stream_global_ranking(db, limit):
+                yield orjson.dumps(entry) + b"\n"
+        except Exception as e:
+            ranking_endpoints.log_error("Global ranking export error", e)
+            # 이미 200 응답이 나간 뒤이므로 마지막 줄로 오류를 알려 잘린 내보내기와 구분
+            yield orjson.dumps({"error": "전체 랭킹 내보내기 중 오류가 발생했습니다"}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @router.get("/organization/{organization}", response_model=APIResponse[OrganizationRankingResponse])
-async def get_organization_ranking(organization: str, limit: int = 100):
+async def get_organization_ranking(organization: str, limit: int = 100, db: AsyncSession = Depends(get_db)):
     """소속별 랭킹 조회 (실시간 solved.ac API 데이터 사용 + DB 자동 동기화)"""
     try:
         # DB에서 소속별 사용자 목록과 CAU 해결 문제 수 조회
-        db_rankings = await ranking_endpoints.db_service.get_organization_ranking(organization, limit)
+        db_rankings = await ranking_endpoints.db_service.get_organization_ranking(db, organization, limit)
 
         # 각 사용자의 실시간 solved.ac 정보 조회 및 병합
         rankings = []
@@ -100,6 +125,7 @@ async def get_organization_ranking(organization: str, limit: int = 100):
 
                 # DB 프로필 정보 동기화 (백그라운드로 실행, 에러 무시)
                 await ranking_endpoints.db_service.update_user_solvedac_profile(
+                    db,
                     username=db_user["username"],
                     tier=solvedac_user.get("tier_name", "Unrated"),
                     rating=solvedac_user.get("rating", 0),
@@ -146,11 +172,11 @@ async def get_organization_ranking(organization: str, limit: int = 100):
 
 
 @router.get("/my-rank/{username}", response_model=APIResponse[MyRankInfo])
-async def get_my_rank(username: str):
+async def get_my_rank(username: str, db: AsyncSession = Depends(get_db)):
     """내 랭킹 정보 조회 (실시간 solved.ac API + DB organization)"""
     try:
         # DB에서 organization과 global_rank 조회
-        db_rank_info = await ranking_endpoints.db_service.get_my_rank_info(username)
+        db_rank_info = await ranking_endpoints.db_service.get_my_rank_info(db, username)
 
         if not db_rank_info:
             raise HTTPException(status_code=404, detail="사용자 랭킹 정보를 찾을 수 없습니다")
@@ -187,15 +213,15 @@ async def get_my_rank(username: str):
 
 
 @router.get("/stats", response_model=APIResponse[RankingStats])
-async def get_ranking_stats(organization: Optional[str] = None):
+async def get_ranking_stats(organization: Optional[str] = None, db: AsyncSession = Depends(get_db)):
     """랭킹 통계 조회"""
     try:
-        stats = await ranking_endpoints.db_service.get_ranking_stats()
+        stats = await ranking_endpoints.db_service.get_ranking_stats(db)
 
         # 소속별 사용자 수 조회
         org_users = 0
         if organization:
-            org_users = await ranking_endpoints.db_service.get_organization_user_count(organization)
+            org_users = await ranking_endpoints.db_service.get_organization_user_count(db, organization)
 
         response_data = RankingStats(
             total_users=stats["total_users"],
@@ -1,5 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import orjson
+
+from app.api.deps import get_db
 
 from app.services.solvedac_service import SolvedACService
 from app.services.gpt_service import GPTService
@@ -36,13 +43,22 @@ async def get_user_dashboard(username: str):
     try:
         user_endpoints.log_user_action(username, "dashboard_access")
 
-        # 병렬로 데이터 수집
-        user_info = await user_endpoints.solvedac_service.get_user_info(username)
-        todays_problems = await user_endpoints.solvedac_service.get_todays_problems(username, count=2)
-        review_problems = await user_endpoints.solvedac_service.get_review_problems(username, count=2)
-        contribution_graph = await user_endpoints.solvedac_service.get_contribution_graph(username, year=2025)
-        recent_activities = await user_endpoints.solvedac_service.get_recent_activities(username, limit=5)
-        weekly_stats = await user_endpoints.solvedac_service.get_weekly_stats(username)
+        # 사용자 정보는 한 번만 조회해 나머지 섹션에 넘기고, 섹션들은 병렬로 수집
+        service = user_endpoints.solvedac_service
+        user_info = await service.get_user_info(username)
+        (
+            todays_problems,
+            review_problems,
+            contribution_graph,
+            recent_activities,
+            weekly_stats
+        ) = await asyncio.gather(
+            service.get_todays_problems(username, count=2, user_info=user_info),
+            service.get_review_problems(username, count=2, user_info=user_info),
+            service.get_contribution_graph(username, year=2025, user_info=user_info),
+            service.get_recent_activities(username, limit=5, user_info=user_info),
+            service.get_weekly_stats(username, user_info=user_info)
+        )
 
         dashboard_data = UserDashboardResponse(
             user_info=user_info,
@@ -66,6 +82,57 @@ async def get_user_dashboard(username: str):
         raise HTTPException(status_code=500, detail="대시보드 정보 조회 중 오류가 발생했습니다")
 
 
+@router.get("/dashboard/{username}/stream")
+async def stream_user_dashboard(username: str):
+    """
+    사용자 대시보드 정보를 섹션별 NDJSON으로 스트리밍
+    - 사용자 정보를 먼저 조회해 첫 줄로 보내고 (없는 사용자면 스트리밍 전에 404)
+    - 나머지 섹션은 그 정보를 받아 병렬로 조회한 뒤 완료되는 순서대로 전송
+    """
+    user_endpoints.log_user_action(username, "dashboard_stream_access")
+    service = user_endpoints.solvedac_service
+
+    try:
+        user_info = await service.get_user_info(username)
+    except UserNotFoundError:
+        raise HTTPException(status_code=404, detail=f"사용자 '{username}'을 찾을 수 없습니다")
+    except Exception as e:
+        user_endpoints.log_error(f"Dashboard stream error for {username} (user_info)", e)
+        raise HTTPException(status_code=500, detail="대시보드 정보 조회 중 오류가 발생했습니다")
+
+    async def fetch_section(section: str, coro):
+        try:
+            return {"section": section, "data": await coro}
+        except Exception as e:
+            user_endpoints.log_error(f"Dashboard stream error for {username} ({section})", e)
+            return {"section": section, "error": "대시보드 정보 조회 중 오류가 발생했습니다"}
+
+    async def generate():
+        yield orjson.dumps({"section": "user_info", "data": user_info}) + b"\n"
+
+        tasks = [
+            asyncio.create_task(fetch_section(
+                "todays_problems", service.get_todays_problems(username, count=2, user_info=user_info))),
+            asyncio.create_task(fetch_section(
+                "review_problems", service.get_review_problems(username, count=2, user_info=user_info))),
+            asyncio.create_task(fetch_section(
+                "contribution_graph", service.get_contribution_graph(username, year=2025, user_info=user_info))),
+            asyncio.create_task(fetch_section(
+                "recent_activities", service.get_recent_activities(username, limit=5, user_info=user_info))),
+            asyncio.create_task(fetch_section(
+                "weekly_stats", service.get_weekly_stats(username, user_info=user_info))),
+        ]
+        try:
+            for next_section in asyncio.as_completed(tasks):
+                yield orjson.dumps(await next_section) + b"\n"
+        finally:
+            # 클라이언트 연결이 끊긴 경우 남은 조회 취소
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/stats/{username}", response_model=APIResponse[UserStatsResponse])
 async def get_user_stats(username: str):
     """사용자 통계 정보 조회"""
@@ -95,19 +162,26 @@ async def get_user_stats(username: str):
 
 
 @router.get("/contribution/{username}", response_model=APIResponse[ContributionGraphResponse])
-async def get_contribution_graph(username: str, months: int = 6):
+async def get_contribution_graph(
+    username: str,
+    months: int = Query(6, ge=1, le=24, description="조회할 개월 수"),
+    db: AsyncSession = Depends(get_db)
+):
     """기여도 그래프 데이터 조회 (CAU Code 활동, 최근 6개월)"""
     try:
         # DB에서 CAU Code 활동 기반 기여도 데이터 조회
-        contribution_data = await user_endpoints.db_service.get_contribution_from_db(username, months)
+        contribution_data = await user_endpoints.db_service.get_contribution_from_db(db, username, months)
+
+        dates = [day["date"] for day in contribution_data]
+        counts = [day["solved_count"] for day in contribution_data]
 
         # 통계 계산
-        total_solved = sum(day["solved_count"] for day in contribution_data)
+        total_solved = sum(counts)
         longest_streak = 0
         current_streak = 0
 
-        for day in contribution_data:
-            if day["solved_count"] > 0:
+        for solved_count in counts:
+            if solved_count > 0:
                 current_streak += 1
                 longest_streak = max(longest_streak, current_streak)
             else:
@@ -115,7 +189,8 @@ async def get_contribution_graph(username: str, months: int = 6):
 
         graph_data = ContributionGraphResponse(
             year=2025,  # 현재 연도로 고정
-            daily_data=contribution_data,
+            dates=dates,
+            counts=counts,
             total_solved_this_year=total_solved,
             longest_streak=longest_streak
         )
@@ -132,15 +207,17 @@ async def get_contribution_graph(username: str, months: int = 6):
 
 
 @router.get("/activities/{username}", response_model=APIResponse[RecentActivityResponse])
-async def get_recent_activities(username: str, limit: int = 3):
-    """최근 활동 내역 조회 (CAU Code 내 활동)"""
+async def get_recent_activities(username: str, limit: int = 3, cursor: Optional[datetime] = None,
+                                db: AsyncSession = Depends(get_db)):
+    """최근 활동 내역 조회 (CAU Code 내 활동, cursor 이전 활동부터)"""
     try:
         # DB에서 CAU Code 내 실제 활동 조회
-        activities = await user_endpoints.db_service.get_recent_activities_from_db(username, limit)
+        activities = await user_endpoints.db_service.get_recent_activities_from_db(db, username, limit, cursor)
 
         activity_data = RecentActivityResponse(
             activities=activities,
-            total_count=len(activities)
+            total_count=len(activities),
+            next_cursor=activities[-1]["timestamp"] if len(activities) == limit else None
         )
 
         return APIResponse(
@@ -155,11 +232,11 @@ async def get_recent_activities(username: str, limit: int = 3):
 
 
 @router.get("/weekly-stats/{username}", response_model=APIResponse[WeeklyStatsResponse])
-async def get_weekly_stats(username: str):
+async def get_weekly_stats(username: str, db: AsyncSession = Depends(get_db)):
     """이번 주 통계 조회 (DB 기반)"""
     try:
         # DB에서 실제 통계 조회
-        stats = await user_endpoints.db_service.get_weekly_stats_from_db(username)
+        stats = await user_endpoints.db_service.get_weekly_stats_from_db(db, username)
 
         weekly_data = WeeklyStatsResponse(
             problems_solved=stats.get("problems_solved", 0),
@@ -181,11 +258,11 @@ async def get_weekly_stats(username: str):
 
 
 @router.get("/todays-problems/{username}", response_model=APIResponse[TodaysProblemsResponse])
-async def get_todays_problems(username: str, count: int = 2):
+async def get_todays_problems(username: str, count: int = 2, db: AsyncSession = Depends(get_db)):
     """오늘의 문제 추천 (날짜별 고정)"""
     try:
         # DB에서 오늘 날짜 고정 문제 조회
-        db_problems = await user_endpoints.db_service.get_daily_problems_from_db(username, "today", count)
+        db_problems = await user_endpoints.db_service.get_daily_problems_from_db(db, username, "today", count)
 
         # DB에 없으면 solved.ac에서 조회하고 저장
         if not db_problems:
@@ -194,7 +271,7 @@ async def get_todays_problems(username: str, count: int = 2):
 
             # solved.ac에서 조회한 문제를 DB에 저장
             if problems:
-                await user_endpoints.db_service.save_daily_problems_to_db(username, "today", problems)
+                await user_endpoints.db_service.save_daily_problems_to_db(db, username, "today", problems)
                 user_endpoints.logger.info(f"Saved {len(problems)} daily problems for {username}")
         else:
             problems = db_problems
@@ -1,26 +1,104 @@
-from openai import AsyncOpenAI
-from typing import Dict, List, Optional, Any
+import asyncio
+import httpx
+from contextlib import asynccontextmanager
+from openai import AsyncOpenAI, APIConnectionError, InternalServerError, RateLimitError
+from typing import AsyncIterator, Dict, List, Optional, Any
 from app.config import settings
 from app.core.exceptions import OpenAIAPIError
 
+# OpenAI 동시 요청 제한 (버스트 시 429 연쇄 방지)
+_openai_semaphore = asyncio.Semaphore(4)
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# 백오프 후 다시 시도할 오류 (SDK 자체 재시도는 끄고 여기서만 재시도)
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
 
 class OpenAIClient:
+    # 모든 인스턴스가 공유하는 AsyncOpenAI 클라이언트 (keep-alive 연결 재사용)
+    _shared_client: Optional[AsyncOpenAI] = None
+
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = self.get_shared_client()
         self.model = "gpt-4o"
 
+    @classmethod
+    def get_shared_client(cls) -> AsyncOpenAI:
+        """공유 AsyncOpenAI 클라이언트 (최초 호출 시 생성)"""
+        if cls._shared_client is None:
+            cls._shared_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                # 재시도는 _completion에서 동시 요청 슬롯을 반납한 채로 처리
+                max_retries=0,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+                )
+            )
+        return cls._shared_client
+
+    @classmethod
+    async def close_shared_client(cls):
+        if cls._shared_client is not None:
+            await cls._shared_client.close()
+            cls._shared_client = None
+
+    @asynccontextmanager
+    async def _completion(self, **kwargs):
+        """
+        채팅 완성 요청 (429/연결/서버 오류 시 지수 백오프로 최대 3회 재시도)
+        - 동시 요청 슬롯은 시도마다 잡고 백오프 대기 중에는 반납
+        - 성공하면 응답(스트림 포함)을 쓰는 동안만 슬롯을 잡고 있음
+        """
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            await _openai_semaphore.acquire()
+            try:
+                response = await self.client.chat.completions.create(model=self.model, **kwargs)
+            except _RETRYABLE_ERRORS:
+                _openai_semaphore.release()
+                if attempt == _MAX_RATE_LIMIT_RETRIES:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+                continue
+            except BaseException:
+                _openai_semaphore.release()
+                raise
+
+            try:
+                yield response
+            finally:
+                _openai_semaphore.release()
+            return
+
     async def _chat_completion(self, messages: List[Dict[str, str]], temperature: float = 0.7, max_tokens: int = 1000) -> str:
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            async with self._completion(
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens
-            )
-            return response.choices[0].message.content.strip()
+            ) as response:
+                return response.choices[0].message.content.strip()
         except Exception as e:
             raise OpenAIAPIError(f"Chat completion failed: {str(e)}")
 
+    async def _stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncIterator[str]:
+        try:
+            async with self._completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            ) as stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise OpenAIAPIError(f"Chat completion stream failed: {str(e)}")
+
     async def analyze_code(self, code: str, problem_description: str, language: str) -> Dict[str, Any]:
         messages = [
             {
@@ -140,6 +218,30 @@ class OpenAIClient:
                 "explanation": "최적화된 솔루션을 생성하는 중 오류가 발생했습니다."
             }
 
+    async def stream_optimized_code(self, problem_description: str, language: str) -> AsyncIterator[str]:
+        """최적 코드를 생성되는 대로 스트리밍 (JSON 대신 바로 렌더링 가능한 마크다운 형식)"""
+        messages = [
+            {
+                "role": "system",
+                "content": """You are a competitive programming expert specializing in algorithm optimization.
+                Generate the MOST TIME-EFFICIENT solution for the given problem.
+                Focus on optimal time complexity, efficient algorithms, and clean implementation.
+
+                Respond in Markdown: first the complete optimized code in a single fenced code block
+                (with comments), then a Korean explanation including the time complexity and the core algorithm."""
+            },
+            {
+                "role": "user",
+                "content": f"""문제: {problem_description}
+                언어: {language}
+
+                이 문제에 대한 최적의 코드와 설명을 제공해주세요."""
+            }
+        ]
+
+        async for delta in self._stream_chat_completion(messages, temperature=0.1, max_tokens=2000):
+            yield delta
+
     async def recommend_problems(
         self,
         user_tier: int,
@@ -1,25 +1,65 @@
+import asyncio
+import math
 import httpx
-from typing import Dict, List, Optional, Any
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from app.core.exceptions import SolvedACAPIError, UserNotFoundError, ProblemNotFoundError
 
+# solved.ac 동시 요청 제한 (느린 응답이 다른 작업을 고갈시키지 않도록)
+_solved_semaphore = asyncio.Semaphore(8)
+
+# 조건부 프로필 조회에서 solved.ac가 304 Not Modified를 반환했을 때의 결과
+PROFILE_NOT_MODIFIED = object()
+
 
 class SolvedACClient:
+    # 모든 인스턴스가 공유하는 HTTP 클라이언트 (서비스마다 연결 풀을 따로 만들지 않도록)
+    _shared_client: Optional[httpx.AsyncClient] = None
+
     def __init__(self):
         self.base_url = "https://solved.ac/api/v3"
         self.timeout = 30.0
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """keep-alive 연결을 재사용하는 공유 HTTP 클라이언트 (최초 요청 시 생성)"""
+        cls = type(self)
+        if cls._shared_client is None or cls._shared_client.is_closed:
+            cls._shared_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60)
+            )
+        return cls._shared_client
+
+    @classmethod
+    async def close_shared_client(cls):
+        if cls._shared_client is not None:
+            await cls._shared_client.aclose()
+            cls._shared_client = None
+
     async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        url = f"{self.base_url}{endpoint}"
+        response = await self._send(method, endpoint, params=params)
+        return response.json()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """요청을 보내고 오류 상태를 예외로 변환 (304는 호출자가 처리하도록 그대로 반환)"""
+        async with _solved_semaphore:
             try:
-                response = await client.request(method, url, params=params)
+                response = await self._get_client().request(method, endpoint, params=params, headers=headers)
 
                 if response.status_code == 404:
                     raise UserNotFoundError("User or resource not found")
+                if response.status_code == 304:
+                    return response
 
                 response.raise_for_status()
-                return response.json()
+                return response
 
             except httpx.HTTPStatusError as e:
                 raise SolvedACAPIError(f"HTTP {e.response.status_code}: {e.response.text}")
@@ -33,6 +73,23 @@ class SolvedACClient:
         """사용자 프로필 정보 조회 (bio 포함)"""
         return await self._request("GET", f"/user/show", params={"handle": username})
 
+    async def get_user_profile_if_modified(
+        self,
+        username: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        ETag 기반 조건부 프로필 조회
+        - 저장된 etag가 그대로면 본문 없이 (PROFILE_NOT_MODIFIED, etag) 반환
+        - 바뀌었으면 (프로필 데이터, 새 ETag) 반환
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        response = await self._send("GET", "/user/show", params={"handle": username}, headers=headers)
+
+        if response.status_code == 304:
+            return PROFILE_NOT_MODIFIED, etag
+        return response.json(), response.headers.get("ETag")
+
     async def get_user_problems(self, username: str) -> Dict[str, Any]:
         return await self._request("GET", f"/search/problem", params={
             "query": f"s@{username}",
@@ -40,6 +97,36 @@ class SolvedACClient:
             "direction": "asc"
         })
 
+    async def iter_user_problems(self, username: str, page_size: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """사용자가 해결한 문제를 페이지 단위로 순서대로 반환 (2페이지부터는 동시에 미리 요청)"""
+        params = {
+            "query": f"s@{username}",
+            "sort": "id",
+            "direction": "asc"
+        }
+
+        first_page = await self._request("GET", "/search/problem", params={**params, "page": 1})
+        yield first_page
+
+        total_pages = math.ceil(first_page.get("count", 0) / page_size)
+        if total_pages <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(5)
+
+        async def fetch_page(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._request("GET", "/search/problem", params={**params, "page": page})
+
+        pending = [asyncio.create_task(fetch_page(page)) for page in range(2, total_pages + 1)]
+        try:
+            for task in pending:
+                yield await task
+        finally:
+            # 호출자가 중간에 순회를 멈추면 남은 페이지 요청은 취소
+            for task in pending:
+                task.cancel()
+
     async def get_user_unsolved_problems(self, username: str) -> Dict[str, Any]:
         return await self._request("GET", f"/search/problem", params={
             "query": f"t@{username} -s@{username}",
@@ -105,8 +192,10 @@ class SolvedACClient:
 
     async def verify_problem_solved(self, username: str, problem_id: int) -> bool:
         try:
-            solved_problems = await self.get_user_problems(username)
-            problem_ids = [p.get("problemId") for p in solved_problems.get("items", [])]
-            return problem_id in problem_ids
+            async with aclosing(self.iter_user_problems(username)) as pages:
+                async for page in pages:
+                    if any(p.get("problemId") == problem_id for p in page.get("items", [])):
+                        return True
+            return False
         except Exception:
             return False
\ No newline at end of file
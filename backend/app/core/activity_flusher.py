@@ -0,0 +1,232 @@
+"""
+Batched writer for user_activities rows.
+Buffers activity records in memory and inserts them in bulk to amortize round-trips and commits.
+Large batches are written with asyncpg COPY, small ones with a single executemany.
+A failed COPY falls back to executemany, and rows with bad data are isolated by splitting the batch.
+Rows that fail with a transient error stay on the flusher and are retried with backoff.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import orjson
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError, StatementError
+
+from app.database import AsyncSessionLocal
+from app.utils.cache import cache_delete_prefix
+
+logger = logging.getLogger(__name__)
+
+_INSERT_ACTIVITY = text("""
+    INSERT INTO user_activities
+    (username, activity_type, problem_id, problem_title, submission_id, metadata)
+    VALUES (:username, :activity_type, :problem_id, :problem_title, :submission_id, :metadata)
+""").bindparams(bindparam("metadata", type_=JSONB))
+
+_COPY_COLUMNS = ("username", "activity_type", "problem_id", "problem_title", "submission_id", "metadata")
+
+# 이 개수 이상이면 executemany 대신 COPY 사용
+_COPY_THRESHOLD = 100
+
+# 워커에게 현재 배치를 저장한 뒤 종료하라고 알리는 큐 항목
+_STOP = object()
+
+# 일시적 오류로 저장에 실패한 배치의 재시도 간격 (지수 백오프, 최대 30초)
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+# 종료 중에는 저장 재시도를 이 횟수까지만 함
+_SHUTDOWN_WRITE_ATTEMPTS = 3
+
+
+def _invalidate_rankings(saved: List[Dict[str, Any]]):
+    """해결 기록이 저장되면 CAU Code 해결 수가 포함된 랭킹 캐시 무효화 (커밋 뒤에 호출)"""
+    if any(activity["activity_type"] == "problem_solved" for activity in saved):
+        cache_delete_prefix("ranking:")
+
+
+def _is_bad_row_error(error: Exception) -> bool:
+    """재시도해도 성공할 수 없는 (행 데이터 자체가 잘못된) 오류인지 확인"""
+    if isinstance(error, (IntegrityError, DataError)):
+        return True
+    # 파라미터 변환 실패처럼 DB에 보내기 전에 난 오류
+    return isinstance(error, StatementError) and not isinstance(error, DBAPIError)
+
+
+class ActivityFlusher:
+    """
+    사용자 활동 기록 일괄 저장기
+    - 큐에 쌓인 활동을 max_batch개 또는 max_wait초마다 한 번에 저장 (대량이면 COPY, 소량이면 executemany)
+    - 저장 중인 배치는 self._pending에 두고, 일시적 오류면 버리지 않고 백오프 후 재시도
+    - 종료 시 워커가 현재 배치를 마저 저장한 뒤 멈추고, 남은 활동을 모두 저장
+    """
+
+    def __init__(self, max_batch: int = 500, max_wait: float = 0.2):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # 큐에서 꺼냈지만 아직 저장되지 않은 활동
+        self._pending: List[Dict[str, Any]] = []
+        self.is_running = False
+
+    async def start(self):
+        """일괄 저장 워커 시작"""
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self._worker = asyncio.create_task(self._run())
+        logger.info("활동 기록 일괄 저장기 시작됨")
+
+    async def stop(self):
+        """워커 중지 후 남은 활동 저장"""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        if self._worker:
+            # 취소하지 않고 종료 신호를 보내 진행 중인 배치를 끝까지 저장하게 함
+            self.queue.put_nowait(_STOP)
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        await self.flush()
+        logger.info("활동 기록 일괄 저장기 중지됨")
+
+    async def put(self, activity: Dict[str, Any]):
+        """활동 기록을 저장 대기열에 추가"""
+        await self.queue.put(activity)
+
+    async def flush(self) -> int:
+        """대기 중인 활동을 즉시 모두 저장 (워커가 멈춘 뒤 호출)"""
+        while not self.queue.empty():
+            activity = self.queue.get_nowait()
+            if activity is not _STOP:
+                self._pending.append(activity)
+
+        count = len(self._pending)
+        if not await self._write_pending():
+            logger.error(f"종료 중 활동 기록 {len(self._pending)}건을 저장하지 못함")
+            return count - len(self._pending)
+        return count
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            stopping = await self._drain()
+            await self._write_pending()
+
+    async def _drain(self) -> bool:
+        """
+        첫 항목을 기다린 뒤 max_wait 동안 max_batch개까지 self._pending에 모음
+        - 종료 신호를 받으면 True
+        """
+        activity = await self.queue.get()
+        if activity is _STOP:
+            return True
+        self._pending.append(activity)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+
+        while len(self._pending) < self.max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                activity = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if activity is _STOP:
+                return True
+            self._pending.append(activity)
+
+        return False
+
+    async def _write_pending(self) -> bool:
+        """
+        self._pending을 저장
+        - 일시적 오류면 백오프 후 재시도 (종료 중에는 _SHUTDOWN_WRITE_ATTEMPTS회까지만)
+        - 모두 저장했으면 True
+        """
+        delay = _RETRY_BASE_DELAY
+        attempt = 0
+        while self._pending:
+            attempt += 1
+            self._pending = await self._write(self._pending)
+            if not self._pending:
+                return True
+
+            if not self.is_running and attempt >= _SHUTDOWN_WRITE_ATTEMPTS:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RETRY_MAX_DELAY)
+
+        return True
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        배치 저장 후 아직 저장하지 못한 활동 반환 (빈 리스트면 모두 저장)
+        - 대량 배치는 COPY로 먼저 시도하고, 실패하면 (COPY는 전부 아니면 전무) executemany로 다시 저장
+        """
+        if len(batch) >= _COPY_THRESHOLD:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await self._copy(session, batch)
+                    await session.commit()
+                _invalidate_rankings(batch)
+                return []
+            except Exception as e:
+                logger.warning(f"활동 기록 COPY 실패, executemany로 다시 저장 ({len(batch)}건): {str(e)}")
+
+        return await self._insert(batch)
+
+    async def _insert(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        executemany로 배치 저장 후 아직 저장하지 못한 활동 반환
+        - 잘못된 행이 있으면 배치를 반으로 나눠 다시 저장해 그 행만 제외
+        - 일시적 오류면 이 배치를 그대로 반환 (호출자가 재시도)
+        """
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(_INSERT_ACTIVITY, batch)
+                await session.commit()
+            _invalidate_rankings(batch)
+            return []
+        except Exception as e:
+            if not _is_bad_row_error(e):
+                logger.warning(f"활동 기록 일괄 저장 실패, 재시도 예정 ({len(batch)}건): {str(e)}")
+                return batch
+            if len(batch) == 1:
+                logger.error(f"잘못된 활동 기록 제외: {batch[0]!r} ({str(e)})")
+                return []
+
+        middle = len(batch) // 2
+        return await self._insert(batch[:middle]) + await self._insert(batch[middle:])
+
+    async def _copy(self, session, batch: List[Dict[str, Any]]):
+        """asyncpg COPY로 활동 기록 일괄 저장 (metadata는 JSON 문자열로 전달)"""
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        records = [
+            (
+                activity["username"],
+                activity["activity_type"],
+                activity.get("problem_id"),
+                activity.get("problem_title"),
+                activity.get("submission_id"),
+                orjson.dumps(activity["metadata"]).decode() if activity.get("metadata") is not None else None,
+            )
+            for activity in batch
+        ]
+        await raw_connection.driver_connection.copy_records_to_table(
+            "user_activities", records=records, columns=_COPY_COLUMNS
+        )
+
+
+# 전역 활동 기록 저장기 인스턴스
+activity_flusher = ActivityFlusher()
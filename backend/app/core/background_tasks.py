@@ -6,7 +6,7 @@ Handles asynchronous task processing with retry logic and error handling.
 import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 import uuid
@@ -14,6 +14,8 @@ import traceback
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class TaskStatus(Enum):
     """작업 상태"""
@@ -25,6 +27,10 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# 더 이상 상태가 바뀌지 않는 종료 상태 (정리 대상)
+_TERMINAL_STATES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
 class TaskPriority(Enum):
     """작업 우선순위"""
     LOW = 1
@@ -48,7 +54,7 @@ class BackgroundTask:
 
     # 상태 관리
     status: TaskStatus = TaskStatus.PENDING
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(_UTC))
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     retry_count: int = 0
@@ -166,6 +172,51 @@ class BackgroundTaskQueue:
         logger.info(f"작업 큐에 추가: {task.name} (ID: {task.id}, 우선순위: {priority.name})")
         return task.id
 
+    async def add_tasks(
+        self,
+        entries: List[Tuple[Callable, tuple, dict]],
+        names: Optional[List[str]] = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        max_retries: int = 3,
+        retry_delay: int = 60,
+        timeout: int = 300
+    ) -> List[str]:
+        """
+        여러 작업을 한 번에 큐에 추가 (중간에 양보 없이 일괄 등록)
+
+        Args:
+            entries: (함수, 인자 튜플, 키워드 인자 딕셔너리) 목록
+            names: 작업 이름 목록 (entries와 같은 순서, 생략 시 함수 이름)
+            priority: 우선순위
+            max_retries: 최대 재시도 횟수
+            retry_delay: 재시도 간격 (초)
+            timeout: 타임아웃 (초)
+
+        Returns:
+            작업 ID 목록
+        """
+        priority_value = -priority.value
+        task_ids = []
+
+        for index, (func, args, kwargs) in enumerate(entries):
+            task = BackgroundTask(
+                name=names[index] if names else func.__name__,
+                func=func,
+                args=args,
+                kwargs=kwargs,
+                priority=priority,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                timeout=timeout
+            )
+            self.tasks[task.id] = task
+            self.pending_queue.put_nowait((priority_value, task.created_at, task.id))
+            task_ids.append(task.id)
+
+        self.stats["total_tasks"] += len(task_ids)
+        logger.info(f"작업 큐에 일괄 추가: {len(task_ids)}개 (우선순위: {priority.name})")
+        return task_ids
+
     async def _worker(self, worker_name: str):
         """워커 태스크"""
         logger.info(f"{worker_name} 시작됨")
@@ -203,7 +254,7 @@ class BackgroundTaskQueue:
             logger.info(f"{worker_name}에서 작업 실행 시작: {task.name} (ID: {task.id})")
 
             task.status = TaskStatus.RUNNING
-            task.started_at = datetime.now(timezone.utc)
+            task.started_at = datetime.now(_UTC)
 
             # 타임아웃과 함께 작업 실행
             task_coroutine = asyncio.create_task(task.func(*task.args, **task.kwargs))
@@ -214,7 +265,7 @@ class BackgroundTaskQueue:
 
                 # 성공 처리
                 task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now(timezone.utc)
+                task.completed_at = datetime.now(_UTC)
                 self.stats["completed_tasks"] += 1
 
                 logger.info(f"작업 완료: {task.name} (ID: {task.id})")
@@ -241,7 +292,7 @@ class BackgroundTaskQueue:
             else:
                 # 최종 실패
                 task.status = TaskStatus.FAILED
-                task.completed_at = datetime.now(timezone.utc)
+                task.completed_at = datetime.now(_UTC)
                 self.stats["failed_tasks"] += 1
 
                 logger.error(f"작업 최종 실패: {task.name} (ID: {task.id})")
@@ -263,7 +314,7 @@ class BackgroundTaskQueue:
             if self.is_running and task.status == TaskStatus.RETRY:
                 task.status = TaskStatus.PENDING
                 priority_value = -task.priority.value
-                await self.pending_queue.put((priority_value, datetime.now(timezone.utc), task.id))
+                await self.pending_queue.put((priority_value, datetime.now(_UTC), task.id))
 
         asyncio.create_task(retry_task())
 
@@ -326,21 +377,21 @@ class BackgroundTaskQueue:
             del self.running_tasks[task_id]
 
         task.status = TaskStatus.CANCELLED
-        task.completed_at = datetime.now(timezone.utc)
+        task.completed_at = datetime.now(_UTC)
 
         logger.info(f"작업 취소됨: {task.name} (ID: {task_id})")
         return True
 
     def cleanup_old_tasks(self, days: int = 7):
         """오래된 작업 기록 정리"""
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-
-        to_remove = []
-        for task_id, task in self.tasks.items():
-            if (task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
-                and task.completed_at
-                and task.completed_at < cutoff_date):
-                to_remove.append(task_id)
+        cutoff_date = datetime.now(_UTC) - timedelta(days=days)
+
+        to_remove = [
+            task_id for task_id, task in self.tasks.items()
+            if task.status in _TERMINAL_STATES
+            and task.completed_at
+            and task.completed_at < cutoff_date
+        ]
 
         for task_id in to_remove:
             del self.tasks[task_id]
@@ -3,6 +3,7 @@ Background task scheduler for CAU Code authentication system.
 Handles periodic verification monitoring and cleanup tasks.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -18,6 +19,9 @@ from app.services.auth_service import auth_service
 
 logger = logging.getLogger(__name__)
 
+# DB 정리 작업 동시 실행 제한 (solved.ac 작업과 장애 영역 분리)
+_db_semaphore = asyncio.Semaphore(20)
+
 
 class BackgroundScheduler:
     """
@@ -32,8 +36,11 @@ class BackgroundScheduler:
         jobstores = {
             'default': MemoryJobStore()
         }
+        # 장애 영역별 executor 분리 (solved.ac 네트워크 작업 / DB 정리 작업)
         executors = {
-            'default': AsyncIOExecutor()
+            'default': AsyncIOExecutor(),
+            'network': AsyncIOExecutor(),
+            'db': AsyncIOExecutor()
         }
         job_defaults = {
             'coalesce': False,
@@ -59,6 +66,7 @@ class BackgroundScheduler:
             trigger=IntervalTrigger(minutes=5),
             id='monitor_verifications',
             name='Monitor Pending Verifications',
+            executor='network',
             replace_existing=True
         )
 
@@ -68,6 +76,7 @@ class BackgroundScheduler:
             trigger=IntervalTrigger(hours=1),
             id='cleanup_sessions',
             name='Cleanup Expired Sessions',
+            executor='db',
             replace_existing=True
         )
 
@@ -77,6 +86,7 @@ class BackgroundScheduler:
             trigger=IntervalTrigger(minutes=30),
             id='cleanup_verifications',
             name='Cleanup Expired Verifications',
+            executor='db',
             replace_existing=True
         )
 
@@ -86,6 +96,7 @@ class BackgroundScheduler:
             trigger=IntervalTrigger(hours=6),
             id='sync_user_profiles',
             name='Sync User Profiles',
+            executor='network',
             replace_existing=True
         )
 
@@ -95,6 +106,7 @@ class BackgroundScheduler:
             trigger=CronTrigger(hour=0, minute=0),
             id='daily_system_check',
             name='Daily System Health Check',
+            executor='db',
             replace_existing=True
         )
 
@@ -132,7 +144,7 @@ class BackgroundScheduler:
         try:
             logger.info("만료된 세션 정리 시작")
 
-            async with AsyncSessionLocal() as db:
+            async with _db_semaphore, AsyncSessionLocal() as db:
                 cleaned_count = await auth_service.cleanup_expired_sessions(db)
 
                 if cleaned_count > 0:
@@ -148,7 +160,7 @@ class BackgroundScheduler:
         try:
             logger.info("만료된 인증 요청 정리 시작")
 
-            async with AsyncSessionLocal() as db:
+            async with _db_semaphore, AsyncSessionLocal() as db:
                 cleaned_count = await profile_verification_service.cleanup_expired_verifications(db)
 
                 if cleaned_count > 0:
@@ -183,14 +195,18 @@ class BackgroundScheduler:
         try:
             logger.info("일일 시스템 상태 체크 시작")
 
-            async with AsyncSessionLocal() as db:
+            async with _db_semaphore, AsyncSessionLocal() as db:
                 # 세션 정리
                 session_count = await auth_service.cleanup_expired_sessions(db)
 
                 # 인증 요청 정리
                 verification_count = await profile_verification_service.cleanup_expired_verifications(db)
 
-                logger.info(f"일일 정리 완료 - 세션: {session_count}개, 인증 요청: {verification_count}개")
+                # 보관 기간이 지난 인증 기록 삭제
+                purged_count = await profile_verification_service.purge_old_verifications(db)
+
+                logger.info(f"일일 정리 완료 - 세션: {session_count}개, 인증 요청: {verification_count}개, "
+                           f"삭제된 인증 기록: {purged_count}개")
 
                 # TODO: 추가 시스템 상태 체크 (DB 연결, API 상태 등)
 
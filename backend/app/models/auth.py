@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, UUID, JSON
-from sqlalchemy.dialects.postgresql import INET
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, UUID, JSON, Index
+from sqlalchemy.dialects.postgresql import INET, JSONB
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from sqlalchemy import ForeignKey
 from app.database import Base
@@ -11,7 +11,7 @@ class User(Base):
     __tablename__ = "users"
 
     user_id = Column(Integer, primary_key=True, index=True)
-    google_id = Column(String(255), unique=True, nullable=False, index=True)
+    google_id = Column(String(255), unique=True, nullable=False)
     email = Column(String(255), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     profile_image_url = Column(String(500), nullable=True)
@@ -25,8 +25,9 @@ class User(Base):
     solvedac_rating = Column(Integer, nullable=True)   # 레이팅
     solvedac_solved_count = Column(Integer, nullable=True)  # 해결한 문제 수
     solvedac_class = Column(Integer, nullable=True)    # 클래스
-    solvedac_profile_data = Column(JSON, nullable=True)  # 추가 프로필 데이터 (캐시용)
     solvedac_last_synced = Column(DateTime(timezone=True), nullable=True)  # 마지막 동기화 시간
+    sync_claimed_at = Column(DateTime(timezone=True), nullable=True)  # 동기화 작업 선점 시간 (중복 예약 방지)
+    solvedac_profile_etag = Column(String(255), nullable=True)  # 마지막으로 받은 solved.ac 프로필 ETag (조건부 요청용)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -34,6 +35,41 @@ class User(Base):
     # Relationships
     sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
     verification_records = relationship("ProfileVerification", back_populates="user", cascade="all, delete-orphan")
+    # 읽기 전용 세션 목록 (cascade 추적 없음, 조회 시 selectinload로 명시 로드)
+    sessions_ro = relationship("UserSession", viewonly=True)
+    # 원본 프로필 JSON은 별도 테이블에 보관 (users 행을 좁게 유지, 필요할 때만 명시 조회)
+    solvedac_cache = relationship("UserSolvedacCache", uselist=False, lazy="noload", viewonly=True)
+
+    __table_args__ = (
+        # Google 로그인 조회를 index-only scan으로 처리하기 위한 커버링 인덱스
+        Index(
+            "ix_users_google_id_cover",
+            "google_id",
+            postgresql_include=["email", "name", "profile_verified", "solvedac_username", "profile_image_url"],
+        ),
+        # 티어 필터 + 레이팅 정렬 조회 (JSONB 표현식 인덱스 대신 비정규화된 스칼라 컬럼 사용)
+        Index("ix_users_tier_rating", "solvedac_tier", solvedac_rating.desc()),
+    )
+
+
+class UserSolvedacCache(Base):
+    __tablename__ = "user_solvedac_cache"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    profile_data = Column(JSONB, nullable=False)  # solved.ac 원본 프로필 데이터
+    last_synced = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # 프로필 캐시 JSONB containment(@>) 조회용 GIN 인덱스
+        Index(
+            "ix_solvedac_cache_profile_gin",
+            "profile_data",
+            postgresql_using="gin",
+            postgresql_ops={"profile_data": "jsonb_path_ops"},
+        ),
+        # 보관 기간 기반 캐시 정리용
+        Index("ix_solvedac_cache_last_synced", "last_synced"),
+    )
 
 
 class UserSession(Base):
@@ -41,7 +77,7 @@ class UserSession(Base):
 
     session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, index=True)
-    access_token_hash = Column(String(255), nullable=False, index=True)
+    access_token_hash = Column(String(255), nullable=False)
     refresh_token_hash = Column(String(255), nullable=True)
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     last_accessed = Column(DateTime(timezone=True), server_default=func.now())
@@ -52,6 +88,18 @@ class UserSession(Base):
     # Relationships
     user = relationship("User", back_populates="sessions")
 
+    __table_args__ = (
+        # 토큰 검증: 해시 + 만료 시각으로 찾고 user_id까지 인덱스에서 바로 반환 (index-only scan)
+        Index(
+            "ix_sessions_token_cover",
+            "access_token_hash",
+            "expires_at",
+            postgresql_include=["user_id"],
+        ),
+        # 사용자별 활성 세션 목록 (최근 접근 순)
+        Index("ix_sessions_user_recent", "user_id", last_accessed.desc()),
+    )
+
 
 class ProfileVerification(Base):
     __tablename__ = "profile_verification"
@@ -69,4 +117,11 @@ class ProfileVerification(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="verification_records")
\ No newline at end of file
+    user = relationship("User", back_populates="verification_records")
+
+    __table_args__ = (
+        # 인증 확인은 대부분 pending 상태만 조회하므로 해당 행만 담는 부분 인덱스
+        Index("ix_pv_pending_lookup", "verification_code", postgresql_where=text("status = 'pending'")),
+        # 보관 기간 기반 기록 삭제용
+        Index("ix_pv_created_at", "created_at"),
+    )
\ No newline at end of file
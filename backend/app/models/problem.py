@@ -3,6 +3,13 @@ from typing import Optional, List, Dict
 from datetime import datetime
 
 
+class AlgorithmTagRef(BaseModel):
+    key: str
+    boj_tag_id: Optional[int] = None
+    problem_count: int = 0
+    name: str = ""
+
+
 class Problem(BaseModel):
     problem_id: int
     title_ko: str
@@ -17,7 +24,7 @@ class Problem(BaseModel):
     is_level_locked: bool = False
     average_tries: float = 0.0
     official: bool = False
-    tags: List[Dict] = []
+    tags: List[AlgorithmTagRef] = []
 
 
 class ProblemInfo(BaseModel):
@@ -1,15 +1,19 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 
+from app.schemas.problem import ProblemId
+
 
 class CodeAnalysisRequest(BaseModel):
     code: str = Field(..., description="분석할 코드")
-    problem_id: int = Field(..., ge=1000, description="문제 번호")
+    problem_id: ProblemId
     language: str = Field(..., description="프로그래밍 언어")
 
 
 class CodeAnalysisResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     score: int = Field(..., ge=0, le=100, description="코드 품질 점수 (0-100)")
     submitted_code: str = Field(..., description="제출된 코드")
     strengths: str = Field(..., max_length=100, description="잘한 점 (100자 이내)")
@@ -22,12 +26,14 @@ class CodeAnalysisResponse(BaseModel):
 
 
 class OptimizedCodeRequest(BaseModel):
-    problem_id: int = Field(..., ge=1000, description="문제 번호")
+    problem_id: ProblemId
     language: str = Field(..., description="프로그래밍 언어")
     current_code: Optional[str] = Field(None, description="현재 코드 (선택사항)")
 
 
 class OptimizedCodeResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     optimized_code: str = Field(..., description="AI가 제안하는 최적 코드")
     explanation: str = Field(..., description="코드 설명 (시간복잡도 포함)")
     time_complexity: str = Field(..., description="시간 복잡도")
@@ -36,6 +42,8 @@ class OptimizedCodeResponse(BaseModel):
 
 
 class FeedbackSummaryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     total_analyses: int = Field(..., description="총 분석 횟수")
     average_score: float = Field(..., description="평균 점수")
     most_common_weaknesses: List[str] = Field(..., description="가장 흔한 약점들")
@@ -44,6 +52,8 @@ class FeedbackSummaryResponse(BaseModel):
 
 
 class CodeMetricsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     lines_of_code: int = Field(..., description="코드 라인 수")
     cyclomatic_complexity: Optional[int] = Field(None, description="순환 복잡도")
     maintainability_index: Optional[float] = Field(None, description="유지보수성 지수")
@@ -57,6 +67,8 @@ class AlgorithmExplanationRequest(BaseModel):
 
 
 class AlgorithmExplanationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     algorithm_type: str = Field(..., description="알고리즘 유형")
     explanation: str = Field(..., description="핵심 개념 설명")
     time_complexity: str = Field(..., description="일반적인 시간복잡도")
@@ -72,6 +84,8 @@ class CodeComparisonRequest(BaseModel):
 
 
 class CodeComparisonResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     original_analysis: Dict = Field(..., description="원본 코드 분석")
     improved_analysis: Dict = Field(..., description="개선된 코드 분석")
     improvement_summary: str = Field(..., description="개선 요약")
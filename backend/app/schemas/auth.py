@@ -1,7 +1,12 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
+import re
+
+
+# Google OAuth가 이미 검증한 이메일이므로 형식만 가볍게 확인
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 # Token Schemas
@@ -27,10 +32,17 @@ class TokenResponse(BaseModel):
 
 # User Schemas
 class UserBase(BaseModel):
-    email: EmailStr
+    email: str
     name: str
     profile_image_url: Optional[str] = None
 
+    @field_validator("email")
+    @classmethod
+    def validate_email_format(cls, value: str) -> str:
+        if not _EMAIL_RE.match(value):
+            raise ValueError("유효하지 않은 이메일 형식입니다.")
+        return value
+
 
 class UserCreate(UserBase):
     google_id: str
@@ -54,8 +66,7 @@ class UserProfile(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class CurrentUser(BaseModel):
@@ -113,8 +124,7 @@ class SessionInfo(BaseModel):
     ip_address: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # Authentication Response Schemas
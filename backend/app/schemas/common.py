@@ -1,12 +1,31 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Generic, TypeVar
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, Generic, Iterable, Tuple, TypeVar
+from datetime import datetime, timezone
 from enum import Enum
 
+from app.utils.helpers import tier_id_to_name, tier_id_to_color
+
 
 DataT = TypeVar('DataT')
 
 
+def _utcnow() -> datetime:
+    """응답 타임스탬프용 UTC 현재 시각 (로컬 타임존 조회 없음)"""
+    return datetime.now(timezone.utc)
+
+
+def prebuild_response_models(routes: Iterable[Any]) -> int:
+    """라우트의 response_model(APIResponse[...] 등) 검증기/직렬화기를 import 시점에 미리 생성"""
+    built = 0
+    for route in routes:
+        model = getattr(route, "response_model", None)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            # 스키마 빌드가 지연된 모델(defer_build, forward ref)을 첫 요청 전에 완성
+            model.model_rebuild()
+            built += 1
+    return built
+
+
 class ResponseStatus(str, Enum):
     SUCCESS = "success"
     ERROR = "error"
@@ -14,18 +33,22 @@ class ResponseStatus(str, Enum):
 
 
 class APIResponse(BaseModel, Generic[DataT]):
+    model_config = ConfigDict(frozen=True)
+
     status: ResponseStatus = Field(..., description="응답 상태")
     message: str = Field(..., description="응답 메시지")
     data: Optional[DataT] = Field(None, description="응답 데이터")
-    timestamp: datetime = Field(default_factory=datetime.now, description="응답 시간")
+    timestamp: datetime = Field(default_factory=_utcnow, description="응답 시간")
 
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: ResponseStatus = ResponseStatus.ERROR
     error_code: str = Field(..., description="에러 코드")
     error_message: str = Field(..., description="에러 메시지")
     details: Optional[Dict[str, Any]] = Field(None, description="에러 세부사항")
-    timestamp: datetime = Field(default_factory=datetime.now, description="에러 발생 시간")
+    timestamp: datetime = Field(default_factory=_utcnow, description="에러 발생 시간")
 
 
 class PaginationRequest(BaseModel):
@@ -36,6 +59,8 @@ class PaginationRequest(BaseModel):
 
 
 class PaginationResponse(BaseModel, Generic[DataT]):
+    model_config = ConfigDict(frozen=True)
+
     items: List[DataT] = Field(..., description="아이템 목록")
     total: int = Field(..., description="전체 아이템 수")
     page: int = Field(..., description="현재 페이지")
@@ -46,20 +71,31 @@ class PaginationResponse(BaseModel, Generic[DataT]):
 
 
 class HealthCheckResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="서비스 상태")
-    timestamp: datetime = Field(default_factory=datetime.now, description="확인 시간")
+    timestamp: datetime = Field(default_factory=_utcnow, description="확인 시간")
     version: str = Field(..., description="서비스 버전")
     uptime: float = Field(..., description="가동 시간 (초)")
     dependencies: Dict[str, str] = Field(..., description="의존성 상태")
 
 
 class TierInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     tier_id: int = Field(..., description="티어 ID")
     tier_name: str = Field(..., description="티어 이름")
     tier_color: str = Field(..., description="티어 색상")
     tier_image_url: Optional[str] = Field(None, description="티어 이미지 URL")
 
 
+# 전체 티어 목록 (Unrated ~ Master, 불변이므로 모듈 로드 시 한 번만 생성)
+TIER_TABLE: Tuple[TierInfo, ...] = tuple(
+    TierInfo(tier_id=tier_id, tier_name=tier_id_to_name(tier_id), tier_color=tier_id_to_color(tier_id))
+    for tier_id in range(32)
+)
+
+
 class AlgorithmTag(BaseModel):
     tag_id: int = Field(..., description="태그 ID")
     tag_name_ko: str = Field(..., description="한국어 태그명")
@@ -1,6 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
-from enum import Enum
+from typing import Annotated, Optional, List, Dict, Any
+from enum import Enum, IntEnum
+
+
+# 요청 스키마에서 공통으로 사용하는 문제 번호 타입 (백준 문제 번호는 1000부터 시작)
+ProblemId = Annotated[int, Field(ge=1000, description="문제 번호")]
 
 
 class RecommendationMode(str, Enum):
@@ -9,37 +13,58 @@ class RecommendationMode(str, Enum):
     CHALLENGE = "challenge"
 
 
-class ProblemTier(str, Enum):
-    BRONZE_5 = "b5"
-    BRONZE_4 = "b4"
-    BRONZE_3 = "b3"
-    BRONZE_2 = "b2"
-    BRONZE_1 = "b1"
-    SILVER_5 = "s5"
-    SILVER_4 = "s4"
-    SILVER_3 = "s3"
-    SILVER_2 = "s2"
-    SILVER_1 = "s1"
-    GOLD_5 = "g5"
-    GOLD_4 = "g4"
-    GOLD_3 = "g3"
-    GOLD_2 = "g2"
-    GOLD_1 = "g1"
-    PLATINUM_5 = "p5"
-    PLATINUM_4 = "p4"
-    PLATINUM_3 = "p3"
-    PLATINUM_2 = "p2"
-    PLATINUM_1 = "p1"
-    DIAMOND_5 = "d5"
-    DIAMOND_4 = "d4"
-    DIAMOND_3 = "d3"
-    DIAMOND_2 = "d2"
-    DIAMOND_1 = "d1"
-    RUBY_5 = "r5"
-    RUBY_4 = "r4"
-    RUBY_3 = "r3"
-    RUBY_2 = "r2"
-    RUBY_1 = "r1"
+# solved.ac 티어 코드 (인덱스 + 1 == 티어 레벨)
+_TIER_CODES = (
+    "b5", "b4", "b3", "b2", "b1",
+    "s5", "s4", "s3", "s2", "s1",
+    "g5", "g4", "g3", "g2", "g1",
+    "p5", "p4", "p3", "p2", "p1",
+    "d5", "d4", "d3", "d2", "d1",
+    "r5", "r4", "r3", "r2", "r1",
+)
+_TIER_BY_CODE = {code: level for level, code in enumerate(_TIER_CODES, start=1)}
+
+
+class ProblemTier(IntEnum):
+    BRONZE_5 = 1
+    BRONZE_4 = 2
+    BRONZE_3 = 3
+    BRONZE_2 = 4
+    BRONZE_1 = 5
+    SILVER_5 = 6
+    SILVER_4 = 7
+    SILVER_3 = 8
+    SILVER_2 = 9
+    SILVER_1 = 10
+    GOLD_5 = 11
+    GOLD_4 = 12
+    GOLD_3 = 13
+    GOLD_2 = 14
+    GOLD_1 = 15
+    PLATINUM_5 = 16
+    PLATINUM_4 = 17
+    PLATINUM_3 = 18
+    PLATINUM_2 = 19
+    PLATINUM_1 = 20
+    DIAMOND_5 = 21
+    DIAMOND_4 = 22
+    DIAMOND_3 = 23
+    DIAMOND_2 = 24
+    DIAMOND_1 = 25
+    RUBY_5 = 26
+    RUBY_4 = 27
+    RUBY_3 = 28
+    RUBY_2 = 29
+    RUBY_1 = 30
+
+    @property
+    def code(self) -> str:
+        """solved.ac 검색 쿼리용 티어 코드 (예: "s3")"""
+        return _TIER_CODES[self.value - 1]
+
+    @classmethod
+    def from_code(cls, code: str) -> "ProblemTier":
+        return cls(_TIER_BY_CODE[code])
 
 
 class ProblemRecommendationRequest(BaseModel):
@@ -59,7 +84,7 @@ class ProblemRecommendationResponse(BaseModel):
 
 
 class ProblemInfoRequest(BaseModel):
-    problem_id: int = Field(..., ge=1000, description="문제 번호")
+    problem_id: ProblemId
 
 
 class ProblemInfoResponse(BaseModel):
@@ -78,7 +103,7 @@ class ProblemInfoResponse(BaseModel):
 
 
 class ProblemVerificationRequest(BaseModel):
-    problem_id: int = Field(..., ge=1000, description="문제 번호")
+    problem_id: ProblemId
     username: str = Field(..., description="사용자 이름")
 
 
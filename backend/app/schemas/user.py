@@ -1,14 +1,16 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from app.models.user import RecentActivity
+
 
 class UserDashboardResponse(BaseModel):
     user_info: dict
     todays_problems: List[dict]
     review_problems: List[dict]
     contribution_graph: List[dict]
-    recent_activities: List[dict]
+    recent_activities: List[RecentActivity]
     weekly_stats: dict
 
 
@@ -23,14 +25,25 @@ class UserStatsResponse(BaseModel):
 
 class ContributionGraphResponse(BaseModel):
     year: int = Field(..., description="년도")
-    daily_data: List[dict] = Field(..., description="일별 해결 현황")
+    # 일별 데이터는 키 반복을 피하기 위해 병렬 배열로 전달 (dates[i] ↔ counts[i])
+    dates: List[str] = Field(..., description="일별 날짜 (YYYY-MM-DD)")
+    counts: List[int] = Field(..., description="일별 해결한 문제 수")
     total_solved_this_year: int = Field(..., description="올해 해결한 문제 수")
     longest_streak: int = Field(..., description="최장 연속 해결일")
 
 
+class ActivityItem(BaseModel):
+    type: str = Field(..., description="활동 유형 (feedback_request, problem_solved)")
+    problem_id: Optional[int] = Field(None, description="문제 번호")
+    description: str = Field(..., description="활동 설명")
+    timestamp: str = Field(..., description="활동 시간 (ISO 8601)")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="추가 데이터")
+
+
 class RecentActivityResponse(BaseModel):
-    activities: List[dict] = Field(..., description="최근 활동 목록")
+    activities: List[ActivityItem] = Field(..., description="최근 활동 목록")
     total_count: int = Field(..., description="전체 활동 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회용 커서 (마지막 활동 시간)")
 
 
 class WeeklyStatsResponse(BaseModel):
@@ -44,7 +57,7 @@ class WeeklyStatsResponse(BaseModel):
 class TodaysProblemsResponse(BaseModel):
     recommended_problems: List[dict] = Field(..., description="오늘의 추천 문제")
     total_count: int = Field(..., description="추천 문제 총 개수")
-    difficulty_distribution: dict = Field(..., description="난이도 분포")
+    difficulty_distribution: Dict[str, int] = Field(..., description="난이도 분포")
 
 
 class ReviewProblemsResponse(BaseModel):
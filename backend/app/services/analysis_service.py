@@ -1,14 +1,50 @@
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Any
+from datetime import datetime, timezone
+import asyncio
 import json
+import time
 
 from app.clients.openai_client import OpenAIClient
 from app.services.solvedac_service import SolvedACService
 from app.utils.helpers import format_time_complexity, generate_algorithm_explanation
-from app.utils.cache import CacheManager, cache_get, cache_set
+from app.utils.cache import CacheManager, cache_get, cache_set, generate_code_hash, normalize_code
 from app.utils.logging import LoggerMixin
 
 
+# 알고리즘 유형별 정적 정보 (호출마다 dict를 새로 만들지 않도록 모듈 로드 시 한 번만 생성)
+_COMPLEXITY_MAP = {
+    "구현": "O(n)",
+    "수학": "O(1) ~ O(log n)",
+    "그리디": "O(n log n)",
+    "다이나믹 프로그래밍": "O(n²) ~ O(n³)",
+    "그래프": "O(V + E)",
+    "문자열": "O(n) ~ O(n²)",
+    "브루트포스": "O(2ⁿ)",
+    "이분탐색": "O(log n)",
+    "정렬": "O(n log n)"
+}
+
+_USE_CASES_MAP = {
+    "구현": ("시뮬레이션 문제", "조건 분기 문제", "배열 조작"),
+    "수학": ("수식 계산", "정수론", "기하학"),
+    "그리디": ("최적화 문제", "스케줄링", "거스름돈 문제"),
+    "다이나믹 프로그래밍": ("최적 부분 구조", "중복 부분 문제", "경우의 수"),
+    "그래프": ("최단경로", "연결성 확인", "위상정렬"),
+    "문자열": ("패턴 매칭", "문자열 처리", "파싱"),
+    "브루트포스": ("완전 탐색", "백트래킹", "순열/조합")
+}
+
+_RELATED_MAP = {
+    "구현": ("시뮬레이션", "완전탐색"),
+    "수학": ("정수론", "기하학", "조합론"),
+    "그리디": ("다이나믹 프로그래밍", "정렬"),
+    "다이나믹 프로그래밍": ("그리디", "분할정복"),
+    "그래프": ("DFS", "BFS", "다익스트라"),
+    "문자열": ("KMP", "라빈카프", "트라이"),
+    "브루트포스": ("백트래킹", "DFS", "BFS")
+}
+
+
 class AnalysisService(LoggerMixin):
     def __init__(self):
         self.openai_client = OpenAIClient()
@@ -25,15 +61,16 @@ class AnalysisService(LoggerMixin):
         """코드 분석 및 피드백 생성"""
         try:
             # 캐시에서 확인
-            cached_analysis = self.cache.get_code_analysis(code, problem_id)
+            cached_analysis = self.cache.get_code_analysis(code, problem_id, language)
             if cached_analysis:
                 self.log_performance("analyze_code_cached", 0.001, {
                     "problem_id": problem_id,
                     "language": language
                 })
-                return cached_analysis
+                # 캐시 키는 정규화된 코드 기준이므로 제출 코드는 이번 요청의 원본으로 교체
+                return {**cached_analysis, "submitted_code": code}
 
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # 문제 정보 조회
             try:
@@ -53,9 +90,9 @@ class AnalysisService(LoggerMixin):
             )
 
             # 캐시에 저장 (30분)
-            self.cache.set_code_analysis(code, problem_id, processed_result, ttl=1800)
+            self.cache.set_code_analysis(code, problem_id, processed_result, ttl=1800, language=language)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self.log_performance("analyze_code", duration, {
                 "problem_id": problem_id,
                 "language": language,
@@ -105,7 +142,7 @@ class AnalysisService(LoggerMixin):
             "time_complexity": time_complexity,
             "algorithm_type": algorithm_type,
             "language": language,
-            "analysis_timestamp": datetime.now(),
+            "analysis_timestamp": datetime.now(timezone.utc),
             "problem_id": problem_id
         }
 
@@ -117,12 +154,12 @@ class AnalysisService(LoggerMixin):
     ) -> Dict[str, Any]:
         """AI 최적 코드 생성"""
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # 캐시 키 생성
             cache_key = f"optimized_code_{problem_id}_{language}"
             if current_code:
-                cache_key += f"_{hash(current_code)}"
+                cache_key += f"_{generate_code_hash(normalize_code(current_code, language))}"
 
             cached_result = cache_get(cache_key)
             if cached_result:
@@ -133,15 +170,7 @@ class AnalysisService(LoggerMixin):
                 return cached_result
 
             # 문제 정보 조회
-            try:
-                problem_info = await self.solvedac_service.get_problem_info(problem_id)
-                problem_description = f"""
-                문제 번호: {problem_id}
-                제목: {problem_info.get('title', 'Unknown')}
-                티어: {problem_info.get('tier_name', 'Unknown')}
-                """
-            except Exception:
-                problem_description = f"문제 번호: {problem_id}"
+            problem_description = await self._get_optimization_problem_description(problem_id)
 
             # OpenAI로 최적 코드 생성
             optimization_result = await self.openai_client.generate_optimized_code(
@@ -156,7 +185,7 @@ class AnalysisService(LoggerMixin):
                 "space_complexity": "O(1)",  # 기본값
                 "problem_id": problem_id,
                 "language": language,
-                "generated_at": datetime.now()
+                "generated_at": datetime.now(timezone.utc)
             }
 
             # 현재 코드와 비교 정보 추가
@@ -170,7 +199,7 @@ class AnalysisService(LoggerMixin):
             # 캐시에 저장 (1시간)
             cache_set(cache_key, processed_result, expire=3600)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self.log_performance("generate_optimized_code", duration, {
                 "problem_id": problem_id,
                 "language": language
@@ -182,6 +211,36 @@ class AnalysisService(LoggerMixin):
             self.log_error(f"Failed to generate optimized code for problem {problem_id}", e)
             raise
 
+    async def _analysis_or_cached(
+        self,
+        cached_analysis: Optional[Dict[str, Any]],
+        code: str,
+        problem_id: int,
+        language: str
+    ) -> Dict[str, Any]:
+        if cached_analysis is not None:
+            return cached_analysis
+        return await self.analyze_code(code, problem_id, language)
+
+    async def stream_optimized_code(self, problem_id: int, language: str) -> AsyncIterator[str]:
+        """AI 최적 코드 생성 (스트리밍)"""
+        problem_description = await self._get_optimization_problem_description(problem_id)
+
+        async for chunk in self.openai_client.stream_optimized_code(problem_description, language):
+            yield chunk
+
+    async def _get_optimization_problem_description(self, problem_id: int) -> str:
+        """최적 코드 생성 프롬프트용 문제 설명"""
+        try:
+            problem_info = await self.solvedac_service.get_problem_info(problem_id)
+            return f"""
+                문제 번호: {problem_id}
+                제목: {problem_info.get('title', 'Unknown')}
+                티어: {problem_info.get('tier_name', 'Unknown')}
+                """
+        except Exception:
+            return f"문제 번호: {problem_id}"
+
     async def get_algorithm_explanation(
         self,
         algorithm_type: str,
@@ -194,7 +253,7 @@ class AnalysisService(LoggerMixin):
             if cached_result:
                 return cached_result
 
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # OpenAI로 알고리즘 설명 생성
             explanation = await self.openai_client.get_algorithm_explanation(algorithm_type)
@@ -206,13 +265,13 @@ class AnalysisService(LoggerMixin):
                 "use_cases": self._get_algorithm_use_cases(algorithm_type),
                 "related_algorithms": self._get_related_algorithms(algorithm_type),
                 "difficulty_rating": difficulty_level,
-                "generated_at": datetime.now()
+                "generated_at": datetime.now(timezone.utc)
             }
 
             # 캐시에 저장 (2시간)
             cache_set(cache_key, result, expire=7200)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self.log_performance("get_algorithm_explanation", duration, {
                 "algorithm_type": algorithm_type
             })
@@ -225,44 +284,15 @@ class AnalysisService(LoggerMixin):
 
     def _get_typical_complexity(self, algorithm_type: str) -> str:
         """알고리즘 유형별 일반적인 시간복잡도"""
-        complexity_map = {
-            "구현": "O(n)",
-            "수학": "O(1) ~ O(log n)",
-            "그리디": "O(n log n)",
-            "다이나믹 프로그래밍": "O(n²) ~ O(n³)",
-            "그래프": "O(V + E)",
-            "문자열": "O(n) ~ O(n²)",
-            "브루트포스": "O(2ⁿ)",
-            "이분탐색": "O(log n)",
-            "정렬": "O(n log n)"
-        }
-        return complexity_map.get(algorithm_type, "O(n)")
+        return _COMPLEXITY_MAP.get(algorithm_type, "O(n)")
 
     def _get_algorithm_use_cases(self, algorithm_type: str) -> List[str]:
         """알고리즘 활용 사례"""
-        use_cases_map = {
-            "구현": ["시뮬레이션 문제", "조건 분기 문제", "배열 조작"],
-            "수학": ["수식 계산", "정수론", "기하학"],
-            "그리디": ["최적화 문제", "스케줄링", "거스름돈 문제"],
-            "다이나믹 프로그래밍": ["최적 부분 구조", "중복 부분 문제", "경우의 수"],
-            "그래프": ["최단경로", "연결성 확인", "위상정렬"],
-            "문자열": ["패턴 매칭", "문자열 처리", "파싱"],
-            "브루트포스": ["완전 탐색", "백트래킹", "순열/조합"]
-        }
-        return use_cases_map.get(algorithm_type, ["일반적인 문제 해결"])
+        return list(_USE_CASES_MAP.get(algorithm_type, ("일반적인 문제 해결",)))
 
     def _get_related_algorithms(self, algorithm_type: str) -> List[str]:
         """관련 알고리즘"""
-        related_map = {
-            "구현": ["시뮬레이션", "완전탐색"],
-            "수학": ["정수론", "기하학", "조합론"],
-            "그리디": ["다이나믹 프로그래밍", "정렬"],
-            "다이나믹 프로그래밍": ["그리디", "분할정복"],
-            "그래프": ["DFS", "BFS", "다익스트라"],
-            "문자열": ["KMP", "라빈카프", "트라이"],
-            "브루트포스": ["백트래킹", "DFS", "BFS"]
-        }
-        return related_map.get(algorithm_type, [])
+        return list(_RELATED_MAP.get(algorithm_type, ()))
 
     async def get_feedback_summary(self, username: str) -> Dict[str, Any]:
         """사용자의 피드백 요약 통계"""
@@ -293,7 +323,7 @@ class AnalysisService(LoggerMixin):
                     "그래프 알고리즘",
                     "문자열 처리"
                 ],
-                "generated_at": datetime.now()
+                "generated_at": datetime.now(timezone.utc)
             }
 
             # 캐시에 저장 (1시간)
@@ -314,11 +344,17 @@ class AnalysisService(LoggerMixin):
     ) -> Dict[str, Any]:
         """코드 비교 분석"""
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
-            # 각각 분석
-            original_analysis = await self.analyze_code(original_code, problem_id, language)
-            improved_analysis = await self.analyze_code(improved_code, problem_id, language)
+            # 캐시를 한 번에 확인하고, 없는 쪽만 동시에 분석
+            original_analysis, improved_analysis = self.cache.get_code_analyses(
+                [original_code, improved_code], problem_id, language
+            )
+            if original_analysis is None or improved_analysis is None:
+                original_analysis, improved_analysis = await asyncio.gather(
+                    self._analysis_or_cached(original_analysis, original_code, problem_id, language),
+                    self._analysis_or_cached(improved_analysis, improved_code, problem_id, language)
+                )
 
             # 비교 결과 생성
             score_improvement = improved_analysis["score"] - original_analysis["score"]
@@ -340,10 +376,10 @@ class AnalysisService(LoggerMixin):
                 "improvement_summary": f"점수가 {score_improvement}점 향상되었습니다.",
                 "performance_gain": round(performance_gain, 2),
                 "recommendation": "개선된 코드가 더 효율적입니다." if score_improvement > 0 else "추가 최적화가 필요합니다.",
-                "analyzed_at": datetime.now()
+                "analyzed_at": datetime.now(timezone.utc)
             }
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self.log_performance("compare_codes", duration, {
                 "problem_id": problem_id,
                 "language": language,
@@ -2,21 +2,35 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
 import uuid
 import hashlib
-from jose import JWTError, jwt
+from functools import lru_cache
+import jwt
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, delete, update, insert, func
+from sqlalchemy.orm import selectinload, raiseload
 
 from app.config import settings
 from app.models.auth import User, UserSession, ProfileVerification
 from app.schemas.auth import TokenData, UserCreate, UserProfile
-from app.database import AsyncSessionLocal
+
+
+@lru_cache(maxsize=1024)
+def _sha256_hex(token: str) -> str:
+    # 같은 토큰이 요청마다 반복 검증되므로 최근 토큰의 해시를 재사용
+    return hashlib.sha256(token.encode()).hexdigest()
 
 
 class AuthService:
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # 신규 해시는 argon2id, 기존 bcrypt 해시는 검증 시 자동 재해시
+        self.pwd_context = CryptContext(
+            schemes=["argon2", "bcrypt"],
+            deprecated=["bcrypt"],
+            argon2__type="ID",
+            argon2__time_cost=2,
+            argon2__memory_cost=64 * 1024,
+            argon2__parallelism=2
+        )
         self.secret_key = settings.secret_key
         self.algorithm = settings.algorithm
         self.access_token_expire_minutes = settings.access_token_expire_minutes
@@ -24,7 +38,7 @@ class AuthService:
 
     def hash_token(self, token: str) -> str:
         """토큰을 해시화하여 저장"""
-        return hashlib.sha256(token.encode()).hexdigest()
+        return _sha256_hex(token)
 
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None):
         """Access Token 생성"""
@@ -62,7 +76,7 @@ class AuthService:
                 return None
 
             return TokenData(user_id=user_id, email=email)
-        except JWTError:
+        except jwt.InvalidTokenError:
             return None
 
     async def create_user_session(
@@ -79,22 +93,23 @@ class AuthService:
         access_token_hash = self.hash_token(access_token)
         refresh_token_hash = self.hash_token(refresh_token)
 
-        # 만료 시간 계산
-        expires_at = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
-
-        # 세션 생성
-        session = UserSession(
-            user_id=user_id,
-            access_token_hash=access_token_hash,
-            refresh_token_hash=refresh_token_hash,
-            expires_at=expires_at,
-            user_agent=user_agent,
-            ip_address=ip_address
-        )
+        # 만료 시간 계산 (DB 시계 기준)
+        expires_at = func.now() + func.make_interval(0, 0, 0, self.refresh_token_expire_days)
 
-        db.add(session)
+        # 세션 생성 (INSERT ... RETURNING으로 서버 기본값까지 한 번에 받아옴)
+        session = await db.scalar(
+            insert(UserSession)
+            .values(
+                user_id=user_id,
+                access_token_hash=access_token_hash,
+                refresh_token_hash=refresh_token_hash,
+                expires_at=expires_at,
+                user_agent=user_agent,
+                ip_address=ip_address
+            )
+            .returning(UserSession)
+        )
         await db.commit()
-        await db.refresh(session)
         return session
 
     async def get_user_by_id(self, db: AsyncSession, user_id: int) -> Optional[User]:
@@ -104,6 +119,15 @@ class AuthService:
         )
         return result.scalar_one_or_none()
 
+    async def get_user_with_sessions(self, db: AsyncSession, user_id: int) -> Optional[User]:
+        """사용자와 세션 목록을 함께 조회 (세션은 IN 쿼리 한 번으로 로드, 그 외 관계는 지연 로딩 금지)"""
+        result = await db.execute(
+            select(User)
+            .options(selectinload(User.sessions_ro), raiseload("*"))
+            .where(User.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_user_by_google_id(self, db: AsyncSession, google_id: str) -> Optional[User]:
         """Google ID로 사용자 조회"""
         result = await db.execute(
@@ -120,16 +144,17 @@ class AuthService:
 
     async def create_user(self, db: AsyncSession, user_data: UserCreate) -> User:
         """새 사용자 생성"""
-        user = User(
-            google_id=user_data.google_id,
-            email=user_data.email,
-            name=user_data.name,
-            profile_image_url=user_data.profile_image_url
+        user = await db.scalar(
+            insert(User)
+            .values(
+                google_id=user_data.google_id,
+                email=user_data.email,
+                name=user_data.name,
+                profile_image_url=user_data.profile_image_url
+            )
+            .returning(User)
         )
-
-        db.add(user)
         await db.commit()
-        await db.refresh(user)
         return user
 
     async def update_user_last_verification_attempt(self, db: AsyncSession, user_id: int):
@@ -149,25 +174,28 @@ class AuthService:
         # 토큰 해시화
         token_hash = self.hash_token(access_token)
 
-        # 세션 조회
-        result = await db.execute(
-            select(UserSession)
-            .options(selectinload(UserSession.user))
+        # 유효한 세션의 마지막 접근 시간 갱신과 사용자 조회를 한 번의 쿼리로 처리
+        touched_session = (
+            update(UserSession)
             .where(
                 UserSession.access_token_hash == token_hash,
-                UserSession.expires_at > datetime.now(timezone.utc)
+                UserSession.expires_at > func.now()
             )
+            .values(last_accessed=func.now())
+            .returning(UserSession.user_id)
+            .cte("touched_session")
+        )
+        result = await db.execute(
+            select(User).join(touched_session, User.user_id == touched_session.c.user_id)
         )
-        session = result.scalar_one_or_none()
+        user = result.scalars().first()
 
-        if not session:
+        if not user:
             return None
 
-        # 마지막 접근 시간 업데이트
-        session.last_accessed = datetime.now(timezone.utc)
         await db.commit()
 
-        return session.user
+        return user
 
     async def revoke_session(self, db: AsyncSession, access_token: str) -> bool:
         """세션 무효화 (로그아웃)"""
@@ -192,7 +220,7 @@ class AuthService:
     async def cleanup_expired_sessions(self, db: AsyncSession) -> int:
         """만료된 세션 정리"""
         result = await db.execute(
-            delete(UserSession).where(UserSession.expires_at < datetime.now(timezone.utc))
+            delete(UserSession).where(UserSession.expires_at < func.now())
         )
         await db.commit()
 
@@ -1,80 +1,172 @@
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Dict, Any, Optional
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.activity_flusher import activity_flusher
 from app.database import AsyncSessionLocal
+from app.utils.cache import cache_get, cache_set, cache_delete_prefix
 from app.utils.logging import LoggerMixin
 from app.utils.helpers import tier_name_to_id
 
 
-class DatabaseService(LoggerMixin):
-    """데이터베이스 서비스 클래스"""
+# 최근 활동 조회 (username, created_at DESC 인덱스로 처리, 커서가 있으면 그 이전부터)
+_RECENT_ACTIVITIES_QUERY = text("""
+    SELECT activity_type, problem_id, problem_title, metadata, created_at
+    FROM user_activities
+    WHERE username = :username
+    ORDER BY created_at DESC
+    LIMIT :limit
+""")
+
+_RECENT_ACTIVITIES_AFTER_CURSOR_QUERY = text("""
+    SELECT activity_type, problem_id, problem_title, metadata, created_at
+    FROM user_activities
+    WHERE username = :username
+    AND created_at < :cursor
+    ORDER BY created_at DESC
+    LIMIT :limit
+""")
+
+# 이번 주 활동을 한 번만 읽어서 세 가지 통계를 한 쿼리로 집계
+# 1. 해결한 문제 수 / 2. 새로운 알고리즘 학습 수 / 3. 피드백 요청 수
+_WEEKLY_STATS_QUERY = text("""
+    WITH week_activities AS (
+        SELECT activity_type, metadata
+        FROM user_activities
+        WHERE username = :username
+        AND activity_type IN ('problem_solved', 'feedback_request')
+        AND created_at >= CAST(:week_start AS date)
+    ),
+    new_tags AS (
+        -- 사용자 해결 이력을 한 번만 훑어 태그별로 그룹화, 모든 등장이 이번 주인 태그만 새 알고리즘
+        SELECT tag
+        FROM user_activities a,
+             jsonb_array_elements_text(a.metadata->'tags') as tag
+        WHERE a.username = :username
+        AND a.activity_type = 'problem_solved'
+        AND jsonb_typeof(a.metadata->'tags') = 'array'
+        GROUP BY tag
+        HAVING bool_and(a.created_at >= CAST(:week_start AS date))
+    )
+    SELECT
+        COUNT(*) FILTER (WHERE activity_type = 'problem_solved') as problems_solved,
+        (SELECT COUNT(*) FROM new_tags) as new_algorithms,
+        COUNT(*) FILTER (WHERE activity_type = 'feedback_request') as feedback_requests
+    FROM week_activities
+""")
+
+# 최근 N개월 일별 해결 수 (조회 컬럼이 모두 idx_user_activity_time 키에 있으므로 인덱스만으로 범위 스캔 후 집계)
+_CONTRIBUTION_QUERY = text("""
+    SELECT
+        created_at::date as date,
+        COUNT(*) as solved_count
+    FROM user_activities
+    WHERE username = :username
+    AND activity_type = 'problem_solved'
+    AND created_at >= NOW() - make_interval(months => :months)
+    GROUP BY 1
+    ORDER BY 1
+""")
+
+# 전체 랭킹 (solved.ac 레이팅 기준)
+_GLOBAL_RANKING_QUERY = text("""
+    SELECT
+        u.solvedac_username,
+        u.organization,
+        u.solvedac_tier,
+        u.solvedac_rating,
+        u.solvedac_solved_count,
+        COALESCE(cau_solved.solved_count, 0) as cau_solved_count,
+        ROW_NUMBER() OVER (ORDER BY u.solvedac_rating DESC NULLS LAST) as rank
+    FROM users u
+    LEFT JOIN user_solved_counts cau_solved ON u.solvedac_username = cau_solved.username
+    WHERE u.profile_verified = true
+    AND u.solvedac_rating IS NOT NULL
+    ORDER BY u.solvedac_rating DESC
+    LIMIT :limit
+""")
+
+# 오늘의 문제 저장 (중복 방지)
+_INSERT_DAILY_PROBLEM = text("""
+    INSERT INTO daily_problems
+    (date, username, problem_type, problem_id, problem_title, problem_tags, tier)
+    VALUES (CURRENT_DATE, :username, :problem_type, :problem_id, :problem_title, :problem_tags, :tier)
+    ON CONFLICT (date, username, problem_type, problem_id) DO NOTHING
+""")
+
+# 활동 유형별 설명 문구
+_ACTIVITY_TEXT = {
+    "feedback_request": "코드 피드백을 요청했습니다: {}",
+    "problem_solved": "문제를 해결완료했습니다: {}",
+}
+
+
+# 랭킹 조회 캐시 유지 시간 (초)
+_RANKING_CACHE_TTL = 300
+
+# 소속/티어 정보가 없을 때 기본 표시값
+_DEFAULT_ORGANIZATION = "미분류"
+_DEFAULT_TIER = "Unrated"
+
+
+def _to_ranking_entry(row) -> Dict[str, Any]:
+    """랭킹 조회 결과 행을 응답용 딕셔너리로 변환"""
+    return {
+        "rank": row["rank"],
+        "username": row["solvedac_username"],
+        "organization": row["organization"] or _DEFAULT_ORGANIZATION,
+        "tier": row["solvedac_tier"] or _DEFAULT_TIER,
+        "rating": row["solvedac_rating"] or 0,
+        "total_solved": row["solvedac_solved_count"] or 0,
+        "cau_solved": row["cau_solved_count"]
+    }
+
+
+# 날짜 계산 기준 시간대 (DB 세션 시간대와 같으므로 CURRENT_DATE와 같은 날짜가 나옴)
+_DB_TIMEZONE = ZoneInfo(settings.db_timezone)
+
+
+def _today() -> date:
+    """DB 세션 시간대 기준 오늘 날짜"""
+    return datetime.now(_DB_TIMEZONE).date()
+
+
+def _current_week_start() -> date:
+    """이번 주 월요일 날짜 (주간 통계 기준일, 쿼리마다 date_trunc 재계산 대신 바인딩)"""
+    today = _today()
+    return today - timedelta(days=today.weekday())
+
+
+def _seconds_until_midnight() -> int:
+    """DB 세션 시간대 기준 오늘 자정까지 남은 초 (일별 데이터 캐시 만료용)"""
+    now = datetime.now(_DB_TIMEZONE)
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min, tzinfo=_DB_TIMEZONE)
+    return max(int((midnight - now).total_seconds()), 1)
+
 
-    async def get_session(self) -> AsyncSession:
-        """DB 세션 반환"""
-        return AsyncSessionLocal()
+class DatabaseService(LoggerMixin):
+    """데이터베이스 서비스 클래스 (요청 단위로 공유되는 세션을 인자로 받음)"""
 
-    async def get_weekly_stats_from_db(self, username: str) -> Dict[str, Any]:
+    async def get_weekly_stats_from_db(self, db: AsyncSession, username: str) -> Dict[str, Any]:
         """DB에서 이번 주 통계 조회"""
         try:
-            async with await self.get_session() as session:
-                # 1. 이번 주 해결한 문제 수
-                problems_solved_query = text("""
-                    SELECT COUNT(*) as count
-                    FROM user_activities
-                    WHERE username = :username
-                    AND activity_type = 'problem_solved'
-                    AND created_at >= date_trunc('week', CURRENT_DATE)
-                """)
-
-                # 2. 이번 주 새로운 알고리즘 학습 수
-                new_algorithms_query = text("""
-                    SELECT COUNT(DISTINCT tag) as count
-                    FROM (
-                        SELECT jsonb_array_elements_text(metadata->'tags') as tag
-                        FROM user_activities
-                        WHERE username = :username
-                        AND activity_type = 'problem_solved'
-                        AND created_at >= date_trunc('week', CURRENT_DATE)
-                        AND metadata ? 'tags'
-                    ) current_week_tags
-                    WHERE tag NOT IN (
-                        SELECT DISTINCT jsonb_array_elements_text(metadata->'tags')
-                        FROM user_activities
-                        WHERE username = :username
-                        AND activity_type = 'problem_solved'
-                        AND created_at < date_trunc('week', CURRENT_DATE)
-                        AND metadata ? 'tags'
-                    )
-                """)
-
-                # 3. 이번 주 피드백 요청 수
-                feedback_requests_query = text("""
-                    SELECT COUNT(*) as count
-                    FROM user_activities
-                    WHERE username = :username
-                    AND activity_type = 'feedback_request'
-                    AND created_at >= date_trunc('week', CURRENT_DATE)
-                """)
-
-                # 쿼리 실행
-                problems_result = await session.execute(problems_solved_query, {"username": username})
-                algorithms_result = await session.execute(new_algorithms_query, {"username": username})
-                feedback_result = await session.execute(feedback_requests_query, {"username": username})
-
-                problems_solved = problems_result.scalar() or 0
-                new_algorithms = algorithms_result.scalar() or 0
-                feedback_requests = feedback_result.scalar() or 0
-
-                return {
-                    "problems_solved": problems_solved,
-                    "new_algorithms": new_algorithms,
-                    "feedback_requests": feedback_requests
-                }
+            row = (await db.execute(_WEEKLY_STATS_QUERY, {
+                "username": username,
+                "week_start": _current_week_start()
+            })).one()
+
+            return {
+                "problems_solved": row.problems_solved or 0,
+                "new_algorithms": row.new_algorithms or 0,
+                "feedback_requests": row.feedback_requests or 0
+            }
 
         except Exception as e:
-            self.log_error(f"DB weekly stats error for {username}", e)
+            self.log_error("DB weekly stats error for %s", e, args=(username,))
+            await db.rollback()
             # DB 오류 시 기본값 반환
             return {
                 "problems_solved": 0,
@@ -82,389 +174,362 @@ class DatabaseService(LoggerMixin):
                 "feedback_requests": 0
             }
 
-    async def get_daily_problems_from_db(self, username: str, problem_type: str, count: int = 2) -> List[Dict[str, Any]]:
-        """DB에서 일별 고정 문제 조회"""
+    async def explain_activity_queries(self, username: str) -> Dict[str, str]:
+        """
+        user_activities 핫 쿼리들의 실행 계획 확인 (인덱스 스캔 사용 여부 점검용, 관리자 진단 API에서 호출)
+        - EXPLAIN ANALYZE는 쿼리를 실제로 실행하므로 전용 세션의 읽기 전용 트랜잭션에서 실행 후 롤백
+        """
+        targets = {
+            "weekly_stats": (_WEEKLY_STATS_QUERY, {"username": username, "week_start": _current_week_start()}),
+            "recent_activities": (_RECENT_ACTIVITIES_QUERY, {"username": username, "limit": 3}),
+            "contribution": (_CONTRIBUTION_QUERY, {"username": username, "months": 6}),
+        }
+
+        plans = {}
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SET TRANSACTION READ ONLY"))
+            for name, (query, params) in targets.items():
+                result = await db.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + query.text), params)
+                plans[name] = "\n".join(row[0] for row in result)
+                self.logger.info(f"EXPLAIN {name}:\n{plans[name]}")
+            await db.rollback()
+
+        return plans
+
+    async def get_daily_problems_from_db(self, db: AsyncSession, username: str, problem_type: str, count: int = 2) -> List[Dict[str, Any]]:
+        """DB에서 일별 고정 문제 조회 (자정까지 캐시)"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    SELECT problem_id, problem_title, problem_tags, tier
-                    FROM daily_problems
-                    WHERE username = :username
-                    AND problem_type = :problem_type
-                    AND date = CURRENT_DATE
-                    LIMIT :count
-                """)
-
-                result = await session.execute(query, {
-                    "username": username,
-                    "problem_type": problem_type,
-                    "count": count
-                })
-
-                problems = []
-                for row in result:
-                    tier_name = row.tier
-                    problems.append({
-                        "problem_id": row.problem_id,
-                        "title": row.problem_title,
-                        "tags": row.problem_tags,  # 전체 태그 배열
-                        "tier_name": tier_name,
-                        "tier": tier_name_to_id(tier_name)  # 숫자 tier 값 추가
-                    })
-
-                return problems
+            cache_key = f"daily_problems:{username}:{problem_type}:{count}:{_today().isoformat()}"
+            cached_problems = cache_get(cache_key)
+            if cached_problems:
+                return cached_problems
+
+            query = text("""
+                SELECT problem_id, problem_title, problem_tags, tier
+                FROM daily_problems
+                WHERE username = :username
+                AND problem_type = :problem_type
+                AND date = CURRENT_DATE
+                LIMIT :count
+            """)
+
+            rows = (await db.execute(query, {
+                "username": username,
+                "problem_type": problem_type,
+                "count": count
+            })).mappings().all()
+
+            problems = [
+                {
+                    "problem_id": row["problem_id"],
+                    "title": row["problem_title"],
+                    "tags": row["problem_tags"],  # 전체 태그 배열
+                    "tier_name": row["tier"],
+                    "tier": tier_name_to_id(row["tier"])  # 숫자 tier 값 추가
+                }
+                for row in rows
+            ]
+
+            # 아직 생성되지 않은 날(빈 결과)은 캐시하지 않음
+            if problems:
+                cache_set(cache_key, problems, expire=_seconds_until_midnight())
+            return problems
 
         except Exception as e:
-            self.log_error(f"DB daily problems error for {username}", e)
+            self.log_error("DB daily problems error for %s", e, args=(username,))
+            await db.rollback()
             return []
 
-    async def get_recent_activities_from_db(self, username: str, limit: int = 3) -> List[Dict[str, Any]]:
-        """DB에서 최근 활동 조회 (CAU Code 내 활동만)"""
+    async def get_recent_activities_from_db(self, db: AsyncSession, username: str, limit: int = 3,
+                                            cursor: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """DB에서 최근 활동 조회 (CAU Code 내 활동만, cursor 이전 활동부터 키셋 페이지네이션)"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    SELECT activity_type, problem_id, problem_title, metadata, created_at
-                    FROM user_activities
-                    WHERE username = :username
-                    ORDER BY created_at DESC
-                    LIMIT :limit
-                """)
-
-                result = await session.execute(query, {
-                    "username": username,
-                    "limit": limit
-                })
-
-                activities = []
-                for row in result:
-                    activity_text = ""
-                    if row.activity_type == "feedback_request":
-                        activity_text = f"코드 피드백을 요청했습니다: {row.problem_title}"
-                    elif row.activity_type == "problem_solved":
-                        activity_text = f"문제를 해결완료했습니다: {row.problem_title}"
-
-                    activities.append({
-                        "type": row.activity_type,
-                        "problem_id": row.problem_id,
-                        "description": activity_text,
-                        "timestamp": row.created_at.isoformat(),
-                        "metadata": row.metadata
-                    })
-
-                return activities
+            params = {"username": username, "limit": limit}
+            if cursor is None:
+                query = _RECENT_ACTIVITIES_QUERY
+            else:
+                query = _RECENT_ACTIVITIES_AFTER_CURSOR_QUERY
+                params["cursor"] = cursor
+
+            rows = (await db.execute(query, params)).mappings().all()
+
+            return [
+                {
+                    "type": row["activity_type"],
+                    "problem_id": row["problem_id"],
+                    "description": _ACTIVITY_TEXT.get(row["activity_type"], "").format(row["problem_title"]),
+                    "timestamp": row["created_at"].isoformat(),
+                    "metadata": row["metadata"]
+                }
+                for row in rows
+            ]
 
         except Exception as e:
-            self.log_error(f"DB recent activities error for {username}", e)
+            self.log_error("DB recent activities error for %s", e, args=(username,))
+            await db.rollback()
             return []
 
-    async def get_contribution_from_db(self, username: str, months: int = 6) -> List[Dict[str, Any]]:
+    async def get_contribution_from_db(self, db: AsyncSession, username: str, months: int = 6) -> List[Dict[str, Any]]:
         """DB에서 최근 N개월 해결 목록 조회 (CAU Code 활동만)"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    SELECT
-                        DATE(created_at) as date,
-                        COUNT(*) as solved_count
-                    FROM user_activities
-                    WHERE username = :username
-                    AND activity_type = 'problem_solved'
-                    AND created_at >= NOW() - INTERVAL :months MONTH
-                    GROUP BY DATE(created_at)
-                    ORDER BY date ASC
-                """)
-
-                result = await session.execute(query, {
-                    "username": username,
-                    "months": months
-                })
-
-                contribution_data = []
-                for row in result:
-                    contribution_data.append({
-                        "date": row.date.isoformat(),
-                        "solved_count": row.solved_count
-                    })
+            rows = (await db.execute(_CONTRIBUTION_QUERY, {
+                "username": username,
+                "months": int(months)
+            })).mappings().all()
 
-                return contribution_data
+            return [
+                {"date": row["date"].isoformat(), "solved_count": row["solved_count"]}
+                for row in rows
+            ]
 
         except Exception as e:
-            self.log_error(f"DB contribution error for {username}", e)
+            self.log_error("DB contribution error for %s", e, args=(username,))
+            await db.rollback()
             return []
 
     async def add_user_activity(self, username: str, activity_type: str, problem_id: int = None,
                               problem_title: str = None, submission_id: str = None,
                               metadata: Dict = None) -> bool:
-        """사용자 활동 기록 추가"""
+        """사용자 활동 기록 추가 (일괄 저장기를 통해 묶어서 INSERT)"""
+        # 필수 값이 없는 기록은 일괄 INSERT 전체를 실패시키므로 큐에 넣기 전에 거름
+        if not username or not activity_type:
+            return False
+
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    INSERT INTO user_activities
-                    (username, activity_type, problem_id, problem_title, submission_id, metadata)
-                    VALUES (:username, :activity_type, :problem_id, :problem_title, :submission_id, :metadata)
-                """)
-
-                await session.execute(query, {
-                    "username": username,
-                    "activity_type": activity_type,
-                    "problem_id": problem_id,
-                    "problem_title": problem_title,
-                    "submission_id": submission_id,
-                    "metadata": metadata
-                })
-
-                await session.commit()
-                return True
+            await activity_flusher.put({
+                "username": username,
+                "activity_type": activity_type,
+                "problem_id": problem_id,
+                "problem_title": problem_title,
+                "submission_id": submission_id,
+                "metadata": metadata
+            })
+            # 랭킹 캐시는 일괄 저장기가 해결 기록을 커밋한 뒤 무효화함
+            return True
 
         except Exception as e:
-            self.log_error(f"Add user activity error for {username}", e)
+            self.log_error("Add user activity error for %s", e, args=(username,))
             return False
 
-    async def save_daily_problems_to_db(self, username: str, problem_type: str,
+    async def save_daily_problems_to_db(self, db: AsyncSession, username: str, problem_type: str,
                                        problems: List[Dict[str, Any]]) -> bool:
         """오늘의 문제를 DB에 저장 (중복 방지)"""
+        if not problems:
+            return True
+
         try:
-            async with await self.get_session() as session:
-                for problem in problems:
-                    query = text("""
-                        INSERT INTO daily_problems
-                        (date, username, problem_type, problem_id, problem_title, problem_tags, tier)
-                        VALUES (CURRENT_DATE, :username, :problem_type, :problem_id, :problem_title, :problem_tags, :tier)
-                        ON CONFLICT (date, username, problem_type, problem_id) DO NOTHING
-                    """)
-
-                    await session.execute(query, {
-                        "username": username,
-                        "problem_type": problem_type,
-                        "problem_id": problem.get("problem_id"),
-                        "problem_title": problem.get("title"),
-                        "problem_tags": problem.get("tags", []),
-                        "tier": problem.get("tier_name")
-                    })
-
-                await session.commit()
-                return True
+            params = [
+                {
+                    "username": username,
+                    "problem_type": problem_type,
+                    "problem_id": problem.get("problem_id"),
+                    "problem_title": problem.get("title"),
+                    "problem_tags": problem.get("tags", []),
+                    "tier": problem.get("tier_name")
+                }
+                for problem in problems
+            ]
+
+            # 한 번의 executemany로 일괄 저장
+            await db.execute(_INSERT_DAILY_PROBLEM, params)
+            await db.commit()
+
+            cache_delete_prefix(f"daily_problems:{username}:{problem_type}:")
+            return True
 
         except Exception as e:
-            self.log_error(f"Save daily problems error for {username}", e)
+            self.log_error("Save daily problems error for %s", e, args=(username,))
+            await db.rollback()
             return False
 
-    async def get_global_ranking(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """전체 랭킹 조회 (solved.ac 레이팅 기준)"""
+    async def get_global_ranking(self, db: AsyncSession, limit: int = 100) -> List[Dict[str, Any]]:
+        """전체 랭킹 조회 (solved.ac 레이팅 기준, 5분 캐시)"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    SELECT
-                        u.solvedac_username,
-                        u.organization,
-                        u.solvedac_tier,
-                        u.solvedac_rating,
-                        u.solvedac_solved_count,
-                        COALESCE(cau_solved.solved_count, 0) as cau_solved_count,
-                        ROW_NUMBER() OVER (ORDER BY u.solvedac_rating DESC NULLS LAST) as rank
-                    FROM users u
-                    LEFT JOIN (
-                        SELECT username, COUNT(*) as solved_count
-                        FROM user_activities
-                        WHERE activity_type = 'problem_solved'
-                        GROUP BY username
-                    ) cau_solved ON u.solvedac_username = cau_solved.username
-                    WHERE u.profile_verified = true
-                    AND u.solvedac_rating IS NOT NULL
-                    ORDER BY u.solvedac_rating DESC
-                    LIMIT :limit
-                """)
-
-                result = await session.execute(query, {"limit": limit})
-
-                rankings = []
-                for row in result:
-                    rankings.append({
-                        "rank": row.rank,
-                        "username": row.solvedac_username,
-                        "organization": row.organization or "미분류",
-                        "tier": row.solvedac_tier or "Unrated",
-                        "rating": row.solvedac_rating or 0,
-                        "total_solved": row.solvedac_solved_count or 0,
-                        "cau_solved": row.cau_solved_count
-                    })
-
-                return rankings
+            cache_key = f"ranking:global:{limit}"
+            cached_rankings = cache_get(cache_key)
+            if cached_rankings is not None:
+                return cached_rankings
+
+            rows = (await db.execute(_GLOBAL_RANKING_QUERY, {"limit": limit})).mappings().all()
+
+            rankings = [_to_ranking_entry(row) for row in rows]
+
+            cache_set(cache_key, rankings, expire=_RANKING_CACHE_TTL)
+            return rankings
 
         except Exception as e:
             self.log_error("Get global ranking error", e)
+            await db.rollback()
             return []
 
-    async def get_organization_ranking(self, organization: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """소속별 랭킹 조회"""
+    async def stream_global_ranking(self, db: AsyncSession, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        """전체 랭킹을 서버 측 커서로 한 행씩 전달 (대량 내보내기용, 전체 목록을 메모리에 올리지 않음)"""
+        result = await db.stream(_GLOBAL_RANKING_QUERY.execution_options(yield_per=200), {"limit": limit})
+        async for row in result.mappings():
+            yield _to_ranking_entry(row)
+
+    async def get_organization_ranking(self, db: AsyncSession, organization: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """소속별 랭킹 조회 (5분 캐시)"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    SELECT
-                        u.solvedac_username,
-                        u.organization,
-                        u.solvedac_tier,
-                        u.solvedac_rating,
-                        u.solvedac_solved_count,
-                        COALESCE(cau_solved.solved_count, 0) as cau_solved_count,
-                        ROW_NUMBER() OVER (ORDER BY u.solvedac_rating DESC NULLS LAST) as rank
-                    FROM users u
-                    LEFT JOIN (
-                        SELECT username, COUNT(*) as solved_count
-                        FROM user_activities
-                        WHERE activity_type = 'problem_solved'
-                        GROUP BY username
-                    ) cau_solved ON u.solvedac_username = cau_solved.username
-                    WHERE u.profile_verified = true
-                    AND u.organization = :organization
-                    AND u.solvedac_rating IS NOT NULL
-                    ORDER BY u.solvedac_rating DESC
-                    LIMIT :limit
-                """)
-
-                result = await session.execute(query, {"organization": organization, "limit": limit})
-
-                rankings = []
-                for row in result:
-                    rankings.append({
-                        "rank": row.rank,
-                        "username": row.solvedac_username,
-                        "organization": row.organization or "미분류",
-                        "tier": row.solvedac_tier or "Unrated",
-                        "rating": row.solvedac_rating or 0,
-                        "total_solved": row.solvedac_solved_count or 0,
-                        "cau_solved": row.cau_solved_count
-                    })
-
-                return rankings
+            cache_key = f"ranking:org:{organization}:{limit}"
+            cached_rankings = cache_get(cache_key)
+            if cached_rankings is not None:
+                return cached_rankings
+
+            query = text("""
+                SELECT
+                    u.solvedac_username,
+                    u.organization,
+                    u.solvedac_tier,
+                    u.solvedac_rating,
+                    u.solvedac_solved_count,
+                    COALESCE(cau_solved.solved_count, 0) as cau_solved_count,
+                    ROW_NUMBER() OVER (ORDER BY u.solvedac_rating DESC NULLS LAST) as rank
+                FROM users u
+                LEFT JOIN user_solved_counts cau_solved ON u.solvedac_username = cau_solved.username
+                WHERE u.profile_verified = true
+                AND u.organization = :organization
+                AND u.solvedac_rating IS NOT NULL
+                ORDER BY u.solvedac_rating DESC
+                LIMIT :limit
+            """)
+
+            rows = (await db.execute(query, {"organization": organization, "limit": limit})).mappings().all()
+
+            rankings = [_to_ranking_entry(row) for row in rows]
+
+            cache_set(cache_key, rankings, expire=_RANKING_CACHE_TTL)
+            return rankings
 
         except Exception as e:
-            self.log_error(f"Get organization ranking error for {organization}", e)
+            self.log_error("Get organization ranking error for %s", e, args=(organization,))
+            await db.rollback()
             return []
 
-    async def get_my_rank_info(self, username: str) -> Dict[str, Any]:
+    async def get_my_rank_info(self, db: AsyncSession, username: str) -> Dict[str, Any]:
         """내 랭킹 정보 조회"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    WITH ranked_users AS (
-                        SELECT
-                            u.solvedac_username,
-                            u.organization,
-                            u.solvedac_tier,
-                            u.solvedac_rating,
-                            u.solvedac_solved_count,
-                            ROW_NUMBER() OVER (ORDER BY u.solvedac_rating DESC NULLS LAST) as global_rank
-                        FROM users u
-                        WHERE u.profile_verified = true
-                        AND u.solvedac_rating IS NOT NULL
-                    )
-                    SELECT * FROM ranked_users WHERE solvedac_username = :username
-                """)
-
-                result = await session.execute(query, {"username": username})
-                row = result.first()
-
-                if not row:
-                    return {}
-
-                return {
-                    "username": row.solvedac_username,
-                    "organization": row.organization or "미분류",
-                    "tier": row.solvedac_tier or "Unrated",
-                    "rating": row.solvedac_rating or 0,
-                    "total_solved": row.solvedac_solved_count or 0,
-                    "global_rank": row.global_rank
-                }
+            # 전체 정렬 대신 나보다 레이팅이 높은 사용자 수를 인덱스 범위로 세어 순위 계산
+            query = text("""
+                SELECT
+                    u.solvedac_username,
+                    u.organization,
+                    u.solvedac_tier,
+                    u.solvedac_rating,
+                    u.solvedac_solved_count,
+                    1 + (
+                        SELECT COUNT(*)
+                        FROM users o
+                        WHERE o.profile_verified = true
+                        AND o.solvedac_rating IS NOT NULL
+                        AND o.solvedac_rating > u.solvedac_rating
+                    ) as global_rank
+                FROM users u
+                WHERE u.solvedac_username = :username
+                AND u.profile_verified = true
+                AND u.solvedac_rating IS NOT NULL
+            """)
+
+            row = (await db.execute(query, {"username": username})).mappings().first()
+
+            if not row:
+                return {}
+
+            return {
+                "username": row["solvedac_username"],
+                "organization": row["organization"] or _DEFAULT_ORGANIZATION,
+                "tier": row["solvedac_tier"] or _DEFAULT_TIER,
+                "rating": row["solvedac_rating"] or 0,
+                "total_solved": row["solvedac_solved_count"] or 0,
+                "global_rank": row["global_rank"]
+            }
 
         except Exception as e:
-            self.log_error(f"Get my rank info error for {username}", e)
+            self.log_error("Get my rank info error for %s", e, args=(username,))
+            await db.rollback()
             return {}
 
-    async def get_ranking_stats(self) -> Dict[str, Any]:
-        """랭킹 통계 조회 (총 사용자 수, 평균 해결 문제 수 등)"""
+    async def get_ranking_stats(self, db: AsyncSession) -> Dict[str, Any]:
+        """랭킹 통계 조회 (총 사용자 수, 평균 해결 문제 수 등, 5분 캐시)"""
         try:
-            async with await self.get_session() as session:
-                # 총 사용자 수
-                total_users_query = text("""
-                    SELECT COUNT(*) as count
-                    FROM users
-                    WHERE profile_verified = true
-                """)
-
-                # 평균 해결 문제 수
-                avg_solved_query = text("""
-                    SELECT AVG(solvedac_solved_count)::INTEGER as avg_solved
-                    FROM users
-                    WHERE profile_verified = true
-                    AND solvedac_solved_count IS NOT NULL
-                """)
-
-                total_result = await session.execute(total_users_query)
-                avg_result = await session.execute(avg_solved_query)
-
-                total_users = total_result.scalar() or 0
-                avg_solved = avg_result.scalar() or 0
-
-                return {
-                    "total_users": total_users,
-                    "avg_solved_count": avg_solved
-                }
+            cached_stats = cache_get("ranking_stats")
+            if cached_stats:
+                return cached_stats
+
+            # 총 사용자 수와 평균 해결 문제 수를 한 번에 집계 (AVG는 NULL 값을 제외)
+            stats_query = text("""
+                SELECT
+                    COUNT(*) as total_users,
+                    AVG(solvedac_solved_count)::INTEGER as avg_solved
+                FROM users
+                WHERE profile_verified = true
+            """)
+
+            row = (await db.execute(stats_query)).one()
+
+            stats = {
+                "total_users": row.total_users or 0,
+                "avg_solved_count": row.avg_solved or 0
+            }
+            cache_set("ranking_stats", stats, expire=300)
+            return stats
 
         except Exception as e:
             self.log_error("Get ranking stats error", e)
+            await db.rollback()
             return {
                 "total_users": 0,
                 "avg_solved_count": 0
             }
 
-    async def get_organization_user_count(self, organization: str) -> int:
+    async def get_organization_user_count(self, db: AsyncSession, organization: str) -> int:
         """특정 소속의 사용자 수 조회"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    SELECT COUNT(*) as count
-                    FROM users
-                    WHERE profile_verified = true
-                    AND organization = :organization
-                """)
+            query = text("""
+                SELECT COUNT(*) as count
+                FROM users
+                WHERE profile_verified = true
+                AND organization = :organization
+            """)
 
-                result = await session.execute(query, {"organization": organization})
-                return result.scalar() or 0
+            result = await db.execute(query, {"organization": organization})
+            return result.scalar() or 0
 
         except Exception as e:
-            self.log_error(f"Get organization user count error for {organization}", e)
+            self.log_error("Get organization user count error for %s", e, args=(organization,))
+            await db.rollback()
             return 0
 
-    async def update_user_solvedac_profile(self, username: str, tier: str, rating: int, solved_count: int) -> bool:
+    async def update_user_solvedac_profile(self, db: AsyncSession, username: str, tier: str, rating: int, solved_count: int) -> bool:
         """사용자의 solved.ac 프로필 정보 업데이트 (실시간 동기화)"""
         try:
-            async with await self.get_session() as session:
-                query = text("""
-                    UPDATE users
-                    SET solvedac_tier = :tier,
-                        solvedac_rating = :rating,
-                        solvedac_solved_count = :solved_count,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE solvedac_username = :username
-                    AND profile_verified = true
-                """)
-
-                result = await session.execute(query, {
-                    "username": username,
-                    "tier": tier,
-                    "rating": rating,
-                    "solved_count": solved_count
-                })
-
-                await session.commit()
-
-                if result.rowcount > 0:
-                    self.logger.info(f"Updated solvedac profile for {username}: tier={tier}, rating={rating}, solved={solved_count}")
-                    return True
-                else:
-                    self.logger.warning(f"No user found to update: {username}")
-                    return False
+            query = text("""
+                UPDATE users
+                SET solvedac_tier = :tier,
+                    solvedac_rating = :rating,
+                    solvedac_solved_count = :solved_count,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE solvedac_username = :username
+                AND profile_verified = true
+            """)
+
+            result = await db.execute(query, {
+                "username": username,
+                "tier": tier,
+                "rating": rating,
+                "solved_count": solved_count
+            })
+
+            await db.commit()
+
+            if result.rowcount > 0:
+                self.logger.info(f"Updated solvedac profile for {username}: tier={tier}, rating={rating}, solved={solved_count}")
+                return True
+            else:
+                self.logger.warning(f"No user found to update: {username}")
+                return False
 
         except Exception as e:
-            self.log_error(f"Update user solvedac profile error for {username}", e)
+            self.log_error("Update user solvedac profile error for %s", e, args=(username,))
+            await db.rollback()
             return False
\ No newline at end of file
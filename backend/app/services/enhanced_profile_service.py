@@ -3,20 +3,26 @@ Enhanced Profile Integration Service for CAU Code.
 Handles automatic profile synchronization and data caching for solved.ac profiles.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, delete, update, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.auth import User
-from app.clients.solvedac_client import SolvedACClient
+from app.models.auth import User, UserSolvedacCache
+from app.clients.solvedac_client import SolvedACClient, PROFILE_NOT_MODIFIED
 from app.core.exceptions import UserNotFoundError, SolvedACAPIError
 from app.core.background_tasks import background_task_queue, TaskPriority
 
 logger = logging.getLogger(__name__)
 
+# 동시에 실행되는 백그라운드 프로필 동기화 수 제한 (solved.ac 응답을 기다리며 DB 세션을 오래 잡지 않도록)
+_profile_sync_semaphore = asyncio.Semaphore(20)
+
 
 class EnhancedProfileService:
     """
@@ -29,6 +35,8 @@ class EnhancedProfileService:
     def __init__(self):
         self.solvedac_client = SolvedACClient()
         self.sync_interval_hours = 6  # 6시간마다 프로필 동기화
+        self.sync_claim_ttl_minutes = 30  # 동기화 선점 유효 시간 (실패한 작업의 선점 해제용)
+        self.sync_batch_size = 500  # 한 번에 선점하고 예약할 사용자 수
         self.cache_duration_hours = 24  # 24시간 캐시 유지
 
     async def sync_user_profile(
@@ -58,7 +66,7 @@ class EnhancedProfileService:
 
             # 최근 동기화 확인 (강제 동기화가 아닌 경우)
             if not force_sync and user.solvedac_last_synced:
-                time_since_sync = datetime.now(timezone.utc) - user.solvedac_last_synced.replace(tzinfo=timezone.utc)
+                time_since_sync = datetime.now(timezone.utc) - user.solvedac_last_synced
                 if time_since_sync < timedelta(hours=self.sync_interval_hours):
                     return {
                         "status": "skipped",
@@ -67,8 +75,29 @@ class EnhancedProfileService:
 
             logger.info(f"프로필 동기화 시작: user_id={user.user_id}, username={user.solvedac_username}")
 
-            # solved.ac 프로필 데이터 가져오기
-            profile_data = await self.solvedac_client.get_user_profile(user.solvedac_username)
+            # solved.ac 프로필 데이터 가져오기 (강제 동기화가 아니면 저장된 ETag로 조건부 요청)
+            # 원본 프로필 캐시 행이 없으면 304로는 다시 채울 수 없으므로 전체 프로필을 받음
+            etag = None
+            if not force_sync and user.solvedac_profile_etag:
+                has_cache_row = await db.scalar(
+                    select(UserSolvedacCache.user_id).where(UserSolvedacCache.user_id == user.user_id)
+                )
+                if has_cache_row is not None:
+                    etag = user.solvedac_profile_etag
+
+            profile_data, etag = await self.solvedac_client.get_user_profile_if_modified(
+                user.solvedac_username,
+                etag=etag
+            )
+
+            if profile_data is PROFILE_NOT_MODIFIED:
+                synced_at = await self._touch_user_sync(db, user)
+                logger.info(f"프로필 변경 없음: user_id={user.user_id}")
+                return {
+                    "status": "skipped",
+                    "reason": "not modified",
+                    "synced_at": synced_at.isoformat()
+                }
 
             if not profile_data:
                 return {
@@ -77,7 +106,7 @@ class EnhancedProfileService:
                 }
 
             # 프로필 데이터 업데이트
-            sync_result = await self._update_user_profile_data(db, user, profile_data)
+            sync_result = await self._update_user_profile_data(db, user, profile_data, etag=etag)
 
             logger.info(f"프로필 동기화 완료: user_id={user.user_id}, "
                        f"tier={sync_result.get('tier')}, "
@@ -86,7 +115,7 @@ class EnhancedProfileService:
             return {
                 "status": "success",
                 "data": sync_result,
-                "synced_at": datetime.now(timezone.utc).isoformat()
+                "synced_at": sync_result["synced_at"].isoformat()
             }
 
         except (UserNotFoundError, SolvedACAPIError) as e:
@@ -106,45 +135,69 @@ class EnhancedProfileService:
         self,
         db: AsyncSession,
         user: User,
-        profile_data: Dict
+        profile_data: Dict,
+        commit: bool = True,
+        etag: Optional[str] = None
     ) -> Dict:
         """
         사용자 프로필 데이터 업데이트
+        - commit=False면 flush만 하고 커밋과 롤백은 호출자에게 맡김 (여러 사용자를 한 트랜잭션으로 저장할 때)
         """
         try:
-            # 기존 데이터와 비교하여 변경사항 확인
+            # 기존 데이터와 비교하여 바뀐 컬럼만 모음 (변경 키, 컬럼, 새 값)
+            candidates = (
+                ('tier', 'solvedac_tier', profile_data.get('tier') or None),
+                ('rating', 'solvedac_rating', profile_data.get('rating')),
+                ('solved_count', 'solvedac_solved_count', profile_data.get('solvedCount')),
+                ('class', 'solvedac_class', profile_data.get('class')),
+            )
             changes = {}
+            new_values = {}
+            for change_key, column, new_value in candidates:
+                old_value = getattr(user, column)
+                if new_value is not None and new_value != old_value:
+                    changes[change_key] = {'old': old_value, 'new': new_value}
+                    new_values[column] = new_value
+
+            # 전체 프로필 데이터 캐시 업데이트 (별도 테이블에 upsert)
+            synced_at = datetime.now(timezone.utc)
+            cache_upsert = insert(UserSolvedacCache).values(
+                user_id=user.user_id,
+                profile_data=profile_data,
+                last_synced=synced_at
+            )
+            await db.execute(
+                cache_upsert.on_conflict_do_update(
+                    index_elements=[UserSolvedacCache.user_id],
+                    set_={
+                        "profile_data": cache_upsert.excluded.profile_data,
+                        "last_synced": cache_upsert.excluded.last_synced
+                    }
+                )
+            )
+            # 바뀐 컬럼과 동기화 시각만 한 번의 UPDATE로 저장 (스케줄러 선점도 해제)
+            await db.execute(
+                update(User)
+                .where(User.user_id == user.user_id)
+                .values(
+                    **new_values,
+                    solvedac_last_synced=synced_at,
+                    updated_at=synced_at,
+                    sync_claimed_at=None,
+                    solvedac_profile_etag=etag
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if commit:
+                await db.commit()
+            else:
+                await db.flush()
 
-            # 티어 업데이트
-            new_tier = profile_data.get('tier')
-            if new_tier and new_tier != user.solvedac_tier:
-                changes['tier'] = {'old': user.solvedac_tier, 'new': new_tier}
-                user.solvedac_tier = new_tier
-
-            # 레이팅 업데이트
-            new_rating = profile_data.get('rating')
-            if new_rating is not None and new_rating != user.solvedac_rating:
-                changes['rating'] = {'old': user.solvedac_rating, 'new': new_rating}
-                user.solvedac_rating = new_rating
-
-            # 해결한 문제 수 업데이트
-            new_solved_count = profile_data.get('solvedCount')
-            if new_solved_count is not None and new_solved_count != user.solvedac_solved_count:
-                changes['solved_count'] = {'old': user.solvedac_solved_count, 'new': new_solved_count}
-                user.solvedac_solved_count = new_solved_count
-
-            # 클래스 업데이트
-            new_class = profile_data.get('class')
-            if new_class is not None and new_class != user.solvedac_class:
-                changes['class'] = {'old': user.solvedac_class, 'new': new_class}
-                user.solvedac_class = new_class
-
-            # 전체 프로필 데이터 캐시 업데이트
-            user.solvedac_profile_data = profile_data
-            user.solvedac_last_synced = datetime.now(timezone.utc)
-            user.updated_at = datetime.now(timezone.utc)
-
-            await db.commit()
+            # ORM 객체는 추가 flush 없이 저장된 값으로 맞춤
+            for column, value in new_values.items():
+                set_committed_value(user, column, value)
+            set_committed_value(user, 'solvedac_last_synced', synced_at)
+            set_committed_value(user, 'solvedac_profile_etag', etag)
 
             result = {
                 "tier": user.solvedac_tier,
@@ -152,7 +205,8 @@ class EnhancedProfileService:
                 "solved_count": user.solvedac_solved_count,
                 "class": user.solvedac_class,
                 "changes": changes,
-                "profile_data": profile_data
+                "profile_data": profile_data,
+                "synced_at": synced_at
             }
 
             if changes:
@@ -161,10 +215,80 @@ class EnhancedProfileService:
             return result
 
         except Exception as e:
-            await db.rollback()
+            if commit:
+                await db.rollback()
             logger.error(f"프로필 데이터 업데이트 실패: {str(e)}")
             raise
 
+    async def _touch_user_sync(self, db: AsyncSession, user: User) -> datetime:
+        """
+        프로필이 바뀌지 않았을 때 동기화 시각만 갱신하고 스케줄러 선점 해제
+        - 원본 프로필 캐시의 last_synced도 갱신해 보관 기간 정리에서 삭제되지 않도록 함
+        """
+        synced_at = datetime.now(timezone.utc)
+        try:
+            await db.execute(
+                update(User)
+                .where(User.user_id == user.user_id)
+                .values(solvedac_last_synced=synced_at, sync_claimed_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.execute(
+                update(UserSolvedacCache)
+                .where(UserSolvedacCache.user_id == user.user_id)
+                .values(last_synced=synced_at)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        set_committed_value(user, 'solvedac_last_synced', synced_at)
+        return synced_at
+
+    async def sync_users_batch(self, db: AsyncSession, users: List[User]) -> Dict:
+        """
+        여러 사용자의 프로필을 한 트랜잭션으로 동기화
+        - solved.ac 프로필은 동시에 조회 (동시 요청 수는 클라이언트 세마포어로 제한)
+        - 사용자별 저장은 SAVEPOINT 안에서 실행해 한 명의 실패가 나머지를 롤백하지 않음
+        - 마지막에 한 번만 커밋
+        """
+        users = [user for user in users if user.profile_verified and user.solvedac_username]
+        if not users:
+            return {"synced_users": 0, "failed_users": 0}
+
+        profiles = await asyncio.gather(
+            *[self.solvedac_client.get_user_profile(user.solvedac_username) for user in users],
+            return_exceptions=True
+        )
+
+        synced_users = 0
+        failed_users = 0
+        try:
+            for user, profile_data in zip(users, profiles):
+                if isinstance(profile_data, Exception) or not profile_data:
+                    logger.warning(f"일괄 동기화: 프로필 조회 실패 (user_id={user.user_id}): {profile_data}")
+                    failed_users += 1
+                    continue
+
+                try:
+                    async with db.begin_nested():
+                        await self._update_user_profile_data(db, user, profile_data, commit=False)
+                    synced_users += 1
+                except Exception:
+                    failed_users += 1
+
+            await db.commit()
+
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"일괄 프로필 동기화 실패: {str(e)}")
+            raise
+
+        logger.info(f"일괄 프로필 동기화 완료 - 성공 {synced_users}명, 실패 {failed_users}명")
+        return {"synced_users": synced_users, "failed_users": failed_users}
+
     async def schedule_background_sync(
         self,
         user_id: int,
@@ -197,10 +321,22 @@ class EnhancedProfileService:
         """
         from app.database import AsyncSessionLocal
 
-        async with AsyncSessionLocal() as db:
-            # 사용자 조회
+        async with _profile_sync_semaphore, AsyncSessionLocal() as db:
+            # 사용자 조회 (동기화에 필요한 컬럼만 로드)
             result = await db.execute(
-                select(User).where(User.user_id == user_id)
+                select(User)
+                .options(load_only(
+                    User.user_id,
+                    User.solvedac_username,
+                    User.profile_verified,
+                    User.solvedac_tier,
+                    User.solvedac_rating,
+                    User.solvedac_solved_count,
+                    User.solvedac_class,
+                    User.solvedac_last_synced,
+                    User.solvedac_profile_etag
+                ))
+                .where(User.user_id == user_id)
             )
             user = result.scalar_one_or_none()
 
@@ -231,7 +367,7 @@ class EnhancedProfileService:
 
             # 캐시 만료 확인
             if user.solvedac_last_synced:
-                cache_age = datetime.now(timezone.utc) - user.solvedac_last_synced.replace(tzinfo=timezone.utc)
+                cache_age = datetime.now(timezone.utc) - user.solvedac_last_synced
                 cache_expired = cache_age > timedelta(hours=self.cache_duration_hours)
             else:
                 cache_expired = True
@@ -247,8 +383,12 @@ class EnhancedProfileService:
                 "cache_expired": cache_expired
             }
 
-            if include_raw_data and user.solvedac_profile_data:
-                profile_cache["raw_data"] = user.solvedac_profile_data
+            if include_raw_data:
+                raw_data = await db.scalar(
+                    select(UserSolvedacCache.profile_data).where(UserSolvedacCache.user_id == user.user_id)
+                )
+                if raw_data:
+                    profile_cache["raw_data"] = raw_data
 
             return profile_cache
 
@@ -263,38 +403,68 @@ class EnhancedProfileService:
         try:
             logger.info("전체 사용자 프로필 동기화 시작")
 
-            # 동기화가 필요한 사용자들 조회
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.sync_interval_hours)
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=self.sync_interval_hours)
+            claim_cutoff = now - timedelta(minutes=self.sync_claim_ttl_minutes)
 
-            result = await db.execute(
-                select(User).where(
+            # 동기화가 필요한 사용자 중 sync_batch_size명 (다른 스케줄러가 잠근 행은 건너뜀)
+            claimable_ids = (
+                select(User.user_id)
+                .where(
                     User.profile_verified == True,
                     User.solvedac_username.isnot(None),
                     # 마지막 동기화가 오래되었거나 한 번도 동기화되지 않은 사용자
-                    (User.solvedac_last_synced.is_(None)) | (User.solvedac_last_synced < cutoff_time)
+                    or_(User.solvedac_last_synced.is_(None), User.solvedac_last_synced < cutoff_time),
+                    # 다른 스케줄러가 이미 선점하지 않은 사용자
+                    or_(User.sync_claimed_at.is_(None), User.sync_claimed_at < claim_cutoff)
                 )
+                .limit(self.sync_batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
             )
-            users_to_sync = result.scalars().all()
 
-            if not users_to_sync:
-                logger.info("동기화할 사용자 없음")
-                return {"synced_users": 0, "scheduled_tasks": 0}
+            synced_users = 0
+            scheduled_tasks = 0
 
-            logger.info(f"{len(users_to_sync)}명의 사용자 프로필 동기화 예약")
+            # 배치 단위로 UPDATE ... RETURNING 선점 후 바로 예약 (메모리는 배치 크기만큼만 사용하고,
+            # 첫 배치의 동기화는 나머지 사용자를 선점하는 동안 이미 시작됨)
+            while True:
+                result = await db.execute(
+                    update(User)
+                    .where(User.user_id.in_(claimable_ids))
+                    .values(sync_claimed_at=func.now())
+                    .returning(User.user_id)
+                    .execution_options(synchronize_session=False)
+                )
+                user_ids = result.scalars().all()
+                await db.commit()
+
+                if not user_ids:
+                    break
+
+                # 백그라운드 작업으로 동기화 일괄 예약
+                task_ids = await background_task_queue.add_tasks(
+                    [(self._background_sync_task, (user_id,), {}) for user_id in user_ids],
+                    names=[f"profile_sync_user_{user_id}" for user_id in user_ids],
+                    priority=TaskPriority.LOW,
+                    max_retries=2,
+                    retry_delay=300,  # 5분
+                    timeout=60  # 1분
+                )
+                synced_users += len(user_ids)
+                scheduled_tasks += len(task_ids)
 
-            # 백그라운드 작업으로 동기화 예약
-            scheduled_tasks = 0
-            for user in users_to_sync:
-                try:
-                    await self.schedule_background_sync(user.user_id, TaskPriority.LOW)
-                    scheduled_tasks += 1
-                except Exception as e:
-                    logger.error(f"동기화 작업 예약 실패: user_id={user.user_id}, error={str(e)}")
+                if len(user_ids) < self.sync_batch_size:
+                    break
+
+            if not synced_users:
+                logger.info("동기화할 사용자 없음")
+                return {"synced_users": 0, "scheduled_tasks": 0}
 
-            logger.info(f"전체 사용자 프로필 동기화 완료 - {scheduled_tasks}개 작업 예약")
+            logger.info(f"전체 사용자 프로필 동기화 완료 - {synced_users}명, {scheduled_tasks}개 작업 예약")
 
             return {
-                "synced_users": len(users_to_sync),
+                "synced_users": synced_users,
                 "scheduled_tasks": scheduled_tasks
             }
 
@@ -302,26 +472,38 @@ class EnhancedProfileService:
             logger.error(f"전체 사용자 동기화 중 오류: {str(e)}")
             return {"synced_users": 0, "scheduled_tasks": 0, "error": str(e)}
 
-    async def cleanup_old_profile_cache(self, db: AsyncSession, days: int = 30) -> int:
+    async def cleanup_old_profile_cache(self, db: AsyncSession, days: int = 30, chunk_size: int = 1000) -> int:
         """
         오래된 프로필 캐시 정리
+        - chunk_size개씩 나눠 삭제하고 청크마다 커밋 (긴 잠금과 큰 WAL 기록 방지)
         """
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-            # 오래된 캐시 데이터 제거 (프로필 데이터만 NULL로 설정)
-            result = await db.execute(
-                update(User)
-                .where(
-                    User.solvedac_last_synced < cutoff_date,
-                    User.solvedac_profile_data.isnot(None)
-                )
-                .values(solvedac_profile_data=None)
+            # 이번 청크에서 지울 캐시 행 (다른 트랜잭션이 잠근 행은 건너뜀)
+            expired_ids = (
+                select(UserSolvedacCache.user_id)
+                .where(UserSolvedacCache.last_synced < cutoff_date)
+                .limit(chunk_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
             )
 
-            await db.commit()
+            # 오래된 캐시 데이터 제거 (원본 프로필 데이터 행만 삭제)
+            cleaned_count = 0
+            while True:
+                result = await db.execute(
+                    delete(UserSolvedacCache).where(UserSolvedacCache.user_id.in_(expired_ids))
+                )
+                await db.commit()
+
+                cleaned_count += result.rowcount
+                if result.rowcount < chunk_size:
+                    break
+
+                # 청크 사이에 다른 작업에 이벤트 루프 양보
+                await asyncio.sleep(0)
 
-            cleaned_count = result.rowcount
             if cleaned_count > 0:
                 logger.info(f"오래된 프로필 캐시 {cleaned_count}개 정리 완료")
 
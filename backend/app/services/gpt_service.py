@@ -1,12 +1,66 @@
-from typing import Dict, List, Optional, Any
-from datetime import datetime
-import json
+from typing import Awaitable, Callable, Dict, List, Optional, Any
+from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
+import bisect
+import orjson
 
 from app.clients.openai_client import OpenAIClient
-from app.utils.cache import CacheManager
+from app.utils.cache import CacheManager, generate_code_hash
 from app.utils.logging import LoggerMixin
 
 
+# 진행 중인 GPT 호출 (같은 캐시 키의 동시 캐시 미스를 하나의 OpenAI 요청으로 합침)
+_gpt_inflight: Dict[str, asyncio.Task] = {}
+
+# 추천 이유 한 번의 요청에 묶을 최대 문제 수
+_REASON_BATCH_SIZE = 10
+
+_DEFAULT_RECOMMENDATION_REASON = "현재 실력에 적합한 문제입니다"
+
+# 기본 학습 계획에서 티어별로 집중할 알고리즘 (각 티어 이상 ~ 다음 키 미만 구간에 적용)
+_ALGORITHM_TIER_KEYS = (1, 5, 10, 15, 20)
+_ALGORITHMS_BY_TIER = {
+    1: ("구현", "수학"),
+    5: ("그리디", "정렬"),
+    10: ("다이나믹 프로그래밍", "그래프"),
+    15: ("트리", "이분탐색"),
+    20: ("세그먼트 트리", "플로우")
+}
+
+
+def _user_profile_block(user_profile: Dict[str, Any]) -> str:
+    """추천 이유 프롬프트에 들어가는 사용자 정보 부분 (요청 한 번에 한 번만 만들어 모든 문제에 재사용)"""
+    return (
+        "사용자 정보:\n"
+        f"- 티어: {user_profile.get('tier', 0)}\n"
+        f"- 레이팅: {user_profile.get('rating', 0)}\n"
+        f"- 해결 문제 수: {user_profile.get('solved_count', 0)}"
+    )
+
+
+@lru_cache(maxsize=512)
+def _default_plan_body(current_tier: int, target_tier: int, weeks: int) -> tuple:
+    """
+    기본 학습 계획 중 입력에만 의존하는 부분 (주차별 목표, 점검 항목, 성공 확률)
+    - 캐시된 값이 호출자에게 수정되지 않도록 튜플로만 구성
+    """
+    weekly_goals = []
+    for week in range(1, weeks + 1):
+        # 난이도를 점진적으로 증가
+        focus_tier = min(target_tier, current_tier + (week * (target_tier - current_tier) // weeks))
+
+        # 해당 티어가 속한 구간의 알고리즘 선택
+        index = max(0, bisect.bisect_right(_ALGORITHM_TIER_KEYS, focus_tier) - 1)
+        algorithms = _ALGORITHMS_BY_TIER[_ALGORITHM_TIER_KEYS[index]]
+
+        weekly_goals.append((week, algorithms, 8 + week * 2, f"티어 {focus_tier} 기준"))
+
+    milestone_checks = tuple(f"{week}주차 목표 달성 확인" for week in range(1, weeks + 1))
+    success_probability = max(0.5, min(0.9, 1.0 - (target_tier - current_tier) * 0.1))
+    return tuple(weekly_goals), milestone_checks, success_probability
+
+
 class GPTService(LoggerMixin):
     """OpenAI GPT 관련 서비스를 담당하는 클래스"""
 
@@ -14,6 +68,27 @@ class GPTService(LoggerMixin):
         self.openai_client = OpenAIClient()
         self.cache = CacheManager()
 
+    def _ttl_for(self, user_profile: Dict[str, Any], base_ttl: int) -> int:
+        """
+        프로필 활동량에 맞춘 캐시 TTL
+        - 해결 수가 적어 프로필 변화가 느리면 최대 base_ttl의 2배, 활발하면(1000문제 이상) 절반까지 줄임
+        - 30분 ~ 1일 범위로 제한
+        """
+        solved_count = min(user_profile.get("solved_count", 0) or 0, 1000)
+        scale = 2.0 - 1.5 * solved_count / 1000
+        return max(1800, min(86400, int(base_ttl * scale)))
+
+    async def _coalesced(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """같은 키로 진행 중인 호출이 있으면 그 결과를 함께 기다림"""
+        task = _gpt_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            _gpt_inflight[key] = task
+            task.add_done_callback(lambda _: _gpt_inflight.pop(key, None))
+
+        # 한 호출자가 취소되어도 다른 대기자를 위해 호출은 계속 진행
+        return await asyncio.shield(task)
+
     async def generate_problem_recommendation_reasoning(
         self,
         user_profile: Dict[str, Any],
@@ -23,25 +98,45 @@ class GPTService(LoggerMixin):
         try:
             start_time = datetime.now()
 
-            enhanced_problems = []
-
-            for problem in problem_list:
-                cache_key = f"recommendation_reason_{problem['problem_id']}_{user_profile['tier']}"
-                cached_reason = self.cache.get(cache_key)
-
+            # 1차: 캐시를 한 번에 조회해서 추천 이유를 채우고 없는 문제만 모음
+            cache_keys = [
+                f"recommendation_reason_{problem['problem_id']}_{user_profile['tier']}"
+                for problem in problem_list
+            ]
+            uncached = []
+            for problem, cache_key, cached_reason in zip(problem_list, cache_keys, self.cache.mget(cache_keys)):
                 if cached_reason:
                     problem["ai_recommendation_reason"] = cached_reason
                 else:
-                    # AI로 추천 이유 생성
-                    reason = await self._generate_single_recommendation_reason(
-                        user_profile, problem
+                    uncached.append((problem, cache_key))
+
+            user_block = _user_profile_block(user_profile)
+
+            # 2차: 캐시에 없는 문제들을 _REASON_BATCH_SIZE개씩 묶어 한 요청으로 추천 이유 생성
+            # (묶음끼리는 동시에 호출, 동시 호출 수는 OpenAI 클라이언트 세마포어로 제한)
+            batches = [uncached[i:i + _REASON_BATCH_SIZE] for i in range(0, len(uncached), _REASON_BATCH_SIZE)]
+            batch_reasons = await asyncio.gather(*[
+                self._coalesced(
+                    f"recommendation_reasons_{user_profile['tier']}_"
+                    + ",".join(str(problem["problem_id"]) for problem, _ in batch),
+                    lambda batch=batch: self._generate_batch_recommendation_reasons(
+                        user_block, [problem for problem, _ in batch]
                     )
-                    problem["ai_recommendation_reason"] = reason
-
-                    # 캐시에 저장 (2시간)
-                    self.cache.set(cache_key, reason, ttl=7200)
-
-                enhanced_problems.append(problem)
+                )
+                for batch in batches
+            ])
+            reasons = [reason for batch in batch_reasons for reason in batch]
+            for (problem, _), reason in zip(uncached, reasons):
+                problem["ai_recommendation_reason"] = reason
+
+            # 새로 생성한 추천 이유를 한 번에 캐시에 저장 (기본 2시간, 프로필 활동량에 따라 조정)
+            if uncached:
+                self.cache.mset(
+                    {cache_key: reason for (_, cache_key), reason in zip(uncached, reasons)},
+                    ttl=self._ttl_for(user_profile, 7200)
+                )
+
+            enhanced_problems = problem_list
 
             duration = (datetime.now() - start_time).total_seconds()
             self.log_performance("generate_recommendation_reasoning", duration, {
@@ -56,9 +151,65 @@ class GPTService(LoggerMixin):
             # 실패 시 원본 리스트 반환
             return problem_list
 
+    async def _generate_batch_recommendation_reasons(
+        self,
+        user_block: str,
+        problems: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        여러 문제의 추천 이유를 한 번의 요청으로 생성
+        - 시스템 프롬프트와 사용자 정보를 문제마다 반복해서 보내지 않음
+        - 응답이 JSON 배열이 아니거나 문제가 빠져 있으면 문제별 개별 생성으로 대체
+        """
+        if len(problems) == 1:
+            return [await self._generate_single_recommendation_reason(user_block, problems[0])]
+
+        problem_lines = "\n".join(
+            f"- 문제 번호: {problem.get('problem_id', 0)} / 제목: {problem.get('title', 'Unknown')}"
+            f" / 티어: {problem.get('tier', 0)} / 알고리즘: {', '.join(problem.get('tags', [])[:2])}"
+            for problem in problems
+        )
+        messages = [
+            {
+                "role": "system",
+                "content": """당신은 코딩 테스트 멘토입니다. 사용자의 프로필과 문제 정보를 바탕으로
+                왜 각 문제를 추천하는지 간단명료하게 설명해주세요. 문제마다 50자 이내로 작성해주세요."""
+            },
+            {
+                "role": "user",
+                "content": f"""
+                {user_block}
+
+                추천 문제 목록:
+                {problem_lines}
+
+                다음 JSON 배열 형식으로만 응답해주세요:
+                [{{"problem_id": 문제 번호, "reason": "추천 이유"}}, ...]
+                """
+            }
+        ]
+
+        try:
+            response = await self.openai_client._chat_completion(
+                messages, temperature=0.5, max_tokens=80 * len(problems)
+            )
+            reason_by_id = {
+                str(item["problem_id"]): str(item["reason"])
+                for item in orjson.loads(response)
+                if isinstance(item, dict) and item.get("reason")
+            }
+            return [reason_by_id[str(problem.get("problem_id"))][:50] for problem in problems]
+
+        except Exception as e:
+            self.logger.warning(f"Failed to generate batched reasons, falling back to per-problem: {e}")
+            return list(await asyncio.gather(*[
+                self._generate_single_recommendation_reason(user_block, problem)
+                for problem in problems
+            ]))
+
     async def _generate_single_recommendation_reason(
         self,
-        user_profile: Dict[str, Any],
+        user_block: str,
         problem: Dict[str, Any]
     ) -> str:
         """단일 문제에 대한 추천 이유 생성"""
@@ -72,10 +223,7 @@ class GPTService(LoggerMixin):
                 {
                     "role": "user",
                     "content": f"""
-                    사용자 정보:
-                    - 티어: {user_profile.get('tier', 0)}
-                    - 레이팅: {user_profile.get('rating', 0)}
-                    - 해결 문제 수: {user_profile.get('solved_count', 0)}
+                    {user_block}
 
                     추천 문제:
                     - 문제 번호: {problem.get('problem_id', 0)}
@@ -89,11 +237,11 @@ class GPTService(LoggerMixin):
             ]
 
             response = await self.openai_client._chat_completion(messages, temperature=0.5)
-            return response[:50] if response else "현재 실력에 적합한 문제입니다"
+            return response[:50] if response else _DEFAULT_RECOMMENDATION_REASON
 
         except Exception as e:
             self.logger.warning(f"Failed to generate reason for problem {problem.get('problem_id')}: {e}")
-            return "현재 실력에 적합한 문제입니다"
+            return _DEFAULT_RECOMMENDATION_REASON
 
     async def analyze_user_weakness(
         self,
@@ -121,7 +269,7 @@ class GPTService(LoggerMixin):
                     사용자 정보:
                     - 티어: {user_profile.get('tier', 0)}
                     - 해결 문제 수: {user_profile.get('solved_count', 0)}
-                    - 최근 제출 기록: {json.dumps(recent_submissions[:5], ensure_ascii=False)}
+                    - 최근 제출 기록: {orjson.dumps(recent_submissions[:5]).decode()}
 
                     다음 형태로 분석해주세요:
                     {{
@@ -134,11 +282,13 @@ class GPTService(LoggerMixin):
                 }
             ]
 
-            response = await self.openai_client._chat_completion(messages, temperature=0.3)
+            response = await self._coalesced(
+                cache_key, lambda: self.openai_client._chat_completion(messages, temperature=0.3)
+            )
 
             try:
-                analysis = json.loads(response)
-            except json.JSONDecodeError:
+                analysis = orjson.loads(response)
+            except orjson.JSONDecodeError:
                 # 파싱 실패 시 기본 분석 제공
                 analysis = {
                     "weak_algorithms": ["다이나믹 프로그래밍", "그래프"],
@@ -148,10 +298,10 @@ class GPTService(LoggerMixin):
                 }
 
             # 분석 시간 추가
-            analysis["analyzed_at"] = datetime.now()
+            analysis["analyzed_at"] = datetime.now(timezone.utc).isoformat()
 
-            # 캐시에 저장 (6시간)
-            self.cache.set(cache_key, analysis, ttl=21600)
+            # 캐시에 저장 (기본 6시간, 프로필 활동량에 따라 조정)
+            self.cache.set(cache_key, analysis, ttl=self._ttl_for(user_profile, 21600))
 
             duration = (datetime.now() - start_time).total_seconds()
             self.log_performance("analyze_user_weakness", duration, {
@@ -168,7 +318,7 @@ class GPTService(LoggerMixin):
                 "recommended_practice": ["기본 문제 연습"],
                 "strength_areas": ["분석 필요"],
                 "next_tier_requirements": "꾸준한 문제 해결",
-                "analyzed_at": datetime.now()
+                "analyzed_at": datetime.now(timezone.utc).isoformat()
             }
 
     async def generate_study_plan(
@@ -222,21 +372,23 @@ class GPTService(LoggerMixin):
                 }
             ]
 
-            response = await self.openai_client._chat_completion(messages, temperature=0.4)
+            response = await self._coalesced(
+                cache_key, lambda: self.openai_client._chat_completion(messages, temperature=0.4)
+            )
 
             try:
-                plan = json.loads(response)
-            except json.JSONDecodeError:
+                plan = orjson.loads(response)
+            except orjson.JSONDecodeError:
                 # 파싱 실패 시 기본 계획 제공
                 plan = self._generate_default_study_plan(current_tier, target_tier, weeks)
 
             # 계획 생성 시간 추가
-            plan["created_at"] = datetime.now()
+            plan["created_at"] = datetime.now(timezone.utc).isoformat()
             plan["current_tier"] = current_tier
             plan["target_tier"] = target_tier
 
-            # 캐시에 저장 (24시간)
-            self.cache.set(cache_key, plan, ttl=86400)
+            # 캐시에 저장 (기본 24시간, 프로필 활동량에 따라 조정)
+            self.cache.set(cache_key, plan, ttl=self._ttl_for(user_profile, 86400))
 
             duration = (datetime.now() - start_time).total_seconds()
             self.log_performance("generate_study_plan", duration, {
@@ -259,37 +411,24 @@ class GPTService(LoggerMixin):
         target_tier: int,
         weeks: int
     ) -> Dict[str, Any]:
-        """기본 학습 계획 생성"""
-        algorithms_by_tier = {
-            1: ["구현", "수학"],
-            5: ["그리디", "정렬"],
-            10: ["다이나믹 프로그래밍", "그래프"],
-            15: ["트리", "이분탐색"],
-            20: ["세그먼트 트리", "플로우"]
-        }
-
-        weekly_goals = []
-        for week in range(1, weeks + 1):
-            # 난이도를 점진적으로 증가
-            focus_tier = min(target_tier, current_tier + (week * (target_tier - current_tier) // weeks))
-
-            # 해당 티어에 적합한 알고리즘 선택
-            algorithms = algorithms_by_tier.get(focus_tier, ["구현", "수학"])
-
-            weekly_goals.append({
-                "week": week,
-                "focus_algorithms": algorithms,
-                "target_problems": 8 + week * 2,
-                "difficulty_level": f"티어 {focus_tier} 기준",
-                "key_concepts": algorithms
-            })
+        """기본 학습 계획 생성 (캐시된 계획 본문을 새 dict로 복사한 뒤 생성 시각 추가)"""
+        weekly_goals, milestone_checks, success_probability = _default_plan_body(current_tier, target_tier, weeks)
 
         return {
-            "weekly_goals": weekly_goals,
+            "weekly_goals": [
+                {
+                    "week": week,
+                    "focus_algorithms": list(algorithms),
+                    "target_problems": target_problems,
+                    "difficulty_level": difficulty_level,
+                    "key_concepts": list(algorithms)
+                }
+                for week, algorithms, target_problems, difficulty_level in weekly_goals
+            ],
             "daily_routine": "매일 2-3문제 해결",
-            "milestone_checks": [f"{week}주차 목표 달성 확인" for week in range(1, weeks + 1)],
-            "success_probability": max(0.5, min(0.9, 1.0 - (target_tier - current_tier) * 0.1)),
-            "created_at": datetime.now(),
+            "milestone_checks": list(milestone_checks),
+            "success_probability": success_probability,
+            "created_at": datetime.now(timezone.utc).isoformat(),
             "current_tier": current_tier,
             "target_tier": target_tier
         }
@@ -301,7 +440,7 @@ class GPTService(LoggerMixin):
     ) -> Dict[str, Any]:
         """문제 해결 접근법 설명"""
         try:
-            cache_key = f"solution_approach_{hash(problem_description)}_{difficulty_tier}"
+            cache_key = f"solution_approach_{generate_code_hash(problem_description)}_{difficulty_tier}"
             cached_explanation = self.cache.get(cache_key)
             if cached_explanation:
                 return cached_explanation
@@ -331,12 +470,14 @@ class GPTService(LoggerMixin):
                 }
             ]
 
-            response = await self.openai_client._chat_completion(messages, temperature=0.3)
+            response = await self._coalesced(
+                cache_key, lambda: self.openai_client._chat_completion(messages, temperature=0.3)
+            )
 
             explanation = {
                 "approach_explanation": response,
                 "difficulty_tier": difficulty_tier,
-                "explained_at": datetime.now()
+                "explained_at": datetime.now(timezone.utc).isoformat()
             }
 
             # 캐시에 저장 (2시간)
@@ -354,5 +495,5 @@ class GPTService(LoggerMixin):
             return {
                 "approach_explanation": "문제 해결 접근법 설명을 생성할 수 없습니다.",
                 "difficulty_tier": difficulty_tier,
-                "explained_at": datetime.now()
+                "explained_at": datetime.now(timezone.utc).isoformat()
             }
\ No newline at end of file
@@ -1,5 +1,7 @@
+import time
 import uuid
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from app.clients.solvedac_client import SolvedACClient
 from app.schemas.guide import (
     ProblemDetailResponse,
@@ -12,48 +14,47 @@ from app.utils.logging import get_logger
 logger = get_logger(__name__)
 
 class GuideService:
-    def __init__(self):
-        self.solvedac_client = SolvedACClient()
-        self.supported_languages = {
-            "python": LanguageInfo(
-                language="python",
-                display_name="Python",
-                extension=".py",
-                compile_command=None,
-                run_command="python3 {file}"
-            ),
-            "java": LanguageInfo(
-                language="java",
-                display_name="Java",
-                extension=".java",
-                compile_command="javac {file}",
-                run_command="java {class}"
-            ),
-            "cpp": LanguageInfo(
-                language="cpp",
-                display_name="C++",
-                extension=".cpp",
-                compile_command="g++ -o {output} {file}",
-                run_command="./{output}"
-            ),
-            "c": LanguageInfo(
-                language="c",
-                display_name="C",
-                extension=".c",
-                compile_command="gcc -o {output} {file}",
-                run_command="./{output}"
-            ),
-            "javascript": LanguageInfo(
-                language="javascript",
-                display_name="JavaScript",
-                extension=".js",
-                compile_command=None,
-                run_command="node {file}"
-            )
-        }
+    # 언어 정보와 템플릿은 모든 인스턴스가 공유 (요청마다 새로 만들지 않도록 클래스 수준에 한 번만 생성)
+    supported_languages: Dict[str, LanguageInfo] = {
+        "python": LanguageInfo(
+            language="python",
+            display_name="Python",
+            extension=".py",
+            compile_command=None,
+            run_command="python3 {file}"
+        ),
+        "java": LanguageInfo(
+            language="java",
+            display_name="Java",
+            extension=".java",
+            compile_command="javac {file}",
+            run_command="java {class}"
+        ),
+        "cpp": LanguageInfo(
+            language="cpp",
+            display_name="C++",
+            extension=".cpp",
+            compile_command="g++ -o {output} {file}",
+            run_command="./{output}"
+        ),
+        "c": LanguageInfo(
+            language="c",
+            display_name="C",
+            extension=".c",
+            compile_command="gcc -o {output} {file}",
+            run_command="./{output}"
+        ),
+        "javascript": LanguageInfo(
+            language="javascript",
+            display_name="JavaScript",
+            extension=".js",
+            compile_command=None,
+            run_command="node {file}"
+        )
+    }
 
-        self.code_templates = {
-            "python": '''# 문제를 해결하는 코드를 작성하세요
+    code_templates: Mapping[str, str] = MappingProxyType({
+        "python": '''# 문제를 해결하는 코드를 작성하세요
 def solution():
     # 입력
 
@@ -65,7 +66,7 @@ def solution():
 if __name__ == "__main__":
     solution()''',
 
-            "java": '''import java.util.*;
+        "java": '''import java.util.*;
 
 public class Main {
     public static void main(String[] args) {
@@ -81,7 +82,7 @@ public class Main {
     }
 }''',
 
-            "cpp": '''#include <iostream>
+        "cpp": '''#include <iostream>
 #include <vector>
 #include <algorithm>
 using namespace std;
@@ -96,7 +97,7 @@ int main() {
     return 0;
 }''',
 
-            "c": '''#include <stdio.h>
+        "c": '''#include <stdio.h>
 #include <stdlib.h>
 
 int main() {
@@ -109,7 +110,7 @@ int main() {
     return 0;
 }''',
 
-            "javascript": '''// 입력 처리
+        "javascript": '''// 입력 처리
 const readline = require('readline');
 const rl = readline.createInterface({
     input: process.stdin,
@@ -125,7 +126,13 @@ rl.on('line', (input) => {
 
     rl.close();
 });'''
-        }
+    })
+
+    # get_supported_languages가 그대로 반환하는 언어 목록
+    _supported_languages_list: Tuple[LanguageInfo, ...] = tuple(supported_languages.values())
+
+    def __init__(self):
+        self.solvedac_client = SolvedACClient()
 
         # 임시 코드 저장소를 전역으로 공유 (실제로는 Redis나 DB 사용 권장)
         if not hasattr(GuideService, '_global_code_storage'):
@@ -183,9 +190,9 @@ rl.on('line', (input) => {
             logger.error(f"Error fetching problem detail for {problem_id}: {str(e)}")
             raise
 
-    def get_supported_languages(self) -> List[LanguageInfo]:
-        """지원하는 언어 목록 반환"""
-        return list(self.supported_languages.values())
+    def get_supported_languages(self) -> Tuple[LanguageInfo, ...]:
+        """지원하는 언어 목록 반환 (미리 만들어 둔 튜플)"""
+        return GuideService._supported_languages_list
 
     def get_language_template(self, language: str) -> str:
         """언어별 템플릿 반환"""
@@ -208,7 +215,8 @@ rl.on('line', (input) => {
                 "problem_id": problem_id,
                 "language": language,
                 "code": code,
-                "timestamp": str(uuid.uuid1().time)
+                # 제출 시각 (Unix epoch 기준 나노초, JS 정수 범위를 넘으므로 문자열로 저장)
+                "timestamp": str(time.time_ns())
             }
 
             logger.info(f"Code submitted for problem {problem_id} with submission ID {submission_id}")
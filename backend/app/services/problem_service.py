@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import asyncio
 import random
 
 from app.clients.solvedac_client import SolvedACClient
@@ -14,6 +15,7 @@ from app.utils.helpers import (
 from app.utils.cache import CacheManager
 from app.utils.logging import LoggerMixin
 from app.schemas.problem import RecommendationMode, ProblemFilterRequest
+from app.schemas.common import TIER_TABLE
 
 
 class ProblemService(LoggerMixin):
@@ -109,49 +111,45 @@ class ProblemService(LoggerMixin):
                 user_tier, user_rating, solved_count, count
             )
 
-            problems = []
+            tags = recommended_tags[:5]  # 최대 5개 태그
+
+            # 티어 범위 계산
+            tier_range = calculate_tier_range_for_recommendations(user_tier)
 
-            for tag in recommended_tags[:5]:  # 최대 5개 태그
-                try:
-                    # 티어 범위 계산
-                    tier_range = calculate_tier_range_for_recommendations(user_tier)
-
-                    # 필터 적용 - 충분한 문제 수량 확보
-                    search_params = {
-                        "algorithm": tag,
-                        "tier": tier_range,
-                        "count": count * 2,  # count에 비례한 충분한 수량
-                        "sort": "random"
-                    }
-
-                    # 사용자 정의 필터 적용
-                    if filters:
-                        search_params.update(self._apply_filters(filters, search_params))
-
-                    # 문제 검색
-                    raw_problems = await self.solvedac_client.search_problems(**search_params)
-
-                    # 현재 필요한 문제 수 계산
-                    remaining_needed = count - len(problems)
-                    if remaining_needed <= 0:
-                        break
-
-                    # 이 태그에서 가져올 문제 수 (남은 문제 수와 API 결과 중 작은 값)
-                    items_to_take = min(len(raw_problems.get("items", [])), remaining_needed)
-
-                    for item in raw_problems.get("items", [])[:items_to_take]:
-                        problem_data = format_solved_ac_problem_data(item)
-                        problem_data["recommendation_reason"] = f"AI가 추천하는 {tag} 유형 문제"
-                        problem_data["confidence_score"] = random.uniform(0.7, 0.95)
-                        problems.append(problem_data)
-
-                        if len(problems) >= count:
-                            break
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to get problems for tag {tag}: {e}")
+            def search_params_for(tag: str) -> Dict[str, Any]:
+                # 필터 적용 - 충분한 문제 수량 확보
+                search_params = {
+                    "algorithm": tag,
+                    "tier": tier_range,
+                    "count": count * 2,  # count에 비례한 충분한 수량
+                    "sort": "random"
+                }
+
+                # 사용자 정의 필터 적용
+                if filters:
+                    search_params.update(self._apply_filters(filters, search_params))
+                return search_params
+
+            # 태그별 문제 검색을 동시에 요청 (동시 요청 수는 solved.ac 클라이언트 세마포어로 제한)
+            results = await asyncio.gather(
+                *[self.solvedac_client.search_problems(**search_params_for(tag)) for tag in tags],
+                return_exceptions=True
+            )
+
+            # 태그 순서대로 필요한 문제 수만큼 채움
+            problems = []
+            for tag, raw_problems in zip(tags, results):
+                if isinstance(raw_problems, Exception):
+                    self.logger.warning(f"Failed to get problems for tag {tag}: {raw_problems}")
                     continue
 
+                # 이 태그에서 가져올 문제 수 (남은 문제 수와 API 결과 중 작은 값)
+                for item in raw_problems.get("items", [])[:count - len(problems)]:
+                    problem_data = format_solved_ac_problem_data(item)
+                    problem_data["recommendation_reason"] = f"AI가 추천하는 {tag} 유형 문제"
+                    problem_data["confidence_score"] = random.uniform(0.7, 0.95)
+                    problems.append(problem_data)
+
                 if len(problems) >= count:
                     break
 
@@ -390,24 +388,28 @@ class ProblemService(LoggerMixin):
                 user_tier, 0, 0, 10  # 더미 값으로 태그만 가져오기
             )
 
-            total_count = 0
-            for tag in recommended_tags[:5]:  # 상위 5개 태그
-                try:
-                    tier_range = f"tier:{max(0, user_tier-2)}..{min(30, user_tier+2)}"
-
-                    # 각 태그별로 추천 가능한 문제 수 조회
-                    search_result = await self.solvedac_client.search_problems(
-                        algorithm=tag,
-                        tier=tier_range,
-                        count=1  # 총 개수만 필요하므로 1개만 조회
-                    )
+            tags = recommended_tags[:5]  # 상위 5개 태그
+            tier_range = f"tier:{max(0, user_tier-2)}..{min(30, user_tier+2)}"
 
-                    # solved.ac API는 총 개수를 제공하지 않으므로 추정값 사용
-                    total_count += random.randint(50, 200)  # 태그당 50-200개 추정
+            # 각 태그별로 추천 가능한 문제 수를 동시에 조회
+            results = await asyncio.gather(*[
+                self.solvedac_client.search_problems(
+                    algorithm=tag,
+                    tier=tier_range,
+                    count=1  # 총 개수만 필요하므로 1개만 조회
+                )
+                for tag in tags
+            ], return_exceptions=True)
 
-                except Exception as e:
-                    self.logger.warning(f"Failed to count problems for tag {tag}: {e}")
+            total_count = 0
+            for tag, search_result in zip(tags, results):
+                if isinstance(search_result, Exception):
+                    self.logger.warning(f"Failed to count problems for tag {tag}: {search_result}")
                     total_count += 100  # 기본값
+                    continue
+
+                # solved.ac API는 총 개수를 제공하지 않으므로 추정값 사용
+                total_count += random.randint(50, 200)  # 태그당 50-200개 추정
 
             return min(total_count, 1500)  # 최대 1500개로 제한
 
@@ -482,10 +484,7 @@ class ProblemService(LoggerMixin):
         try:
             # 더미 데이터 (실제로는 solved.ac API에서 가져와야 함)
             options = {
-                "available_tiers": [
-                    {"tier_id": i, "tier_name": tier_id_to_name(i)}
-                    for i in range(32)
-                ],
+                "available_tiers": list(TIER_TABLE),
                 "available_algorithms": [
                     {"tag_name": "implementation", "problem_count": 1500},
                     {"tag_name": "math", "problem_count": 1200},
@@ -342,6 +342,32 @@ class ProfileVerificationService:
             await db.rollback()
             return 0
 
+    async def purge_old_verifications(self, db: AsyncSession, retention_days: int = 30) -> int:
+        """
+        보관 기간이 지난 완료/만료 인증 기록 삭제 (pending 요청은 유지)
+        """
+        try:
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
+            result = await db.execute(
+                delete(ProfileVerification)
+                .where(
+                    ProfileVerification.created_at < cutoff_date,
+                    ProfileVerification.status != 'pending'
+                )
+            )
+            await db.commit()
+
+            purged_count = result.rowcount
+            if purged_count > 0:
+                logger.info(f"오래된 인증 기록 {purged_count}개 삭제 완료")
+
+            return purged_count
+
+        except Exception as e:
+            logger.error(f"오래된 인증 기록 삭제 실패: {str(e)}")
+            await db.rollback()
+            return 0
+
 
 # 전역 프로필 인증 서비스 인스턴스
 profile_verification_service = ProfileVerificationService()
\ No newline at end of file
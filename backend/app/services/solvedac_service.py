@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
+import asyncio
 import random
 import hashlib
 
@@ -16,6 +17,9 @@ from app.utils.cache import CacheManager
 from app.utils.logging import LoggerMixin
 from app.core.exceptions import UserNotFoundError, SolvedACAPIError
 
+# 진행 중인 문제 정보 조회 (같은 문제의 동시 캐시 미스를 하나의 요청으로 합침)
+_problem_info_inflight: Dict[int, asyncio.Task] = {}
+
 
 class SolvedACService(LoggerMixin):
     def __init__(self):
@@ -82,10 +86,11 @@ class SolvedACService(LoggerMixin):
             self.log_error(f"Failed to get solved problems for {username}", e)
             raise
 
-    async def get_todays_problems(self, username: str, count: int = 2) -> List[Dict[str, Any]]:
+    async def get_todays_problems(self, username: str, count: int = 2, user_info: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """오늘의 문제 추천"""
         try:
-            user_info = await self.get_user_info(username)
+            # 호출자가 이미 조회한 사용자 정보가 있으면 재사용
+            user_info = user_info or await self.get_user_info(username)
             user_tier = user_info.get("tier", 0)
             tier_range = calculate_tier_range_for_recommendations(user_tier)
 
@@ -150,10 +155,11 @@ class SolvedACService(LoggerMixin):
             self.log_error(f"Failed to get today's problems for {username}", e)
             raise
 
-    async def get_review_problems(self, username: str, count: int = 2) -> List[Dict[str, Any]]:
+    async def get_review_problems(self, username: str, count: int = 2, user_info: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """복습할 문제 추천 - 틀린 문제 개수에 따른 전략"""
         try:
-            user_info = await self.get_user_info(username)
+            # 호출자가 이미 조회한 사용자 정보가 있으면 재사용
+            user_info = user_info or await self.get_user_info(username)
             user_tier = user_info.get("tier", 0)
             start_time = datetime.now()
 
@@ -274,7 +280,7 @@ class SolvedACService(LoggerMixin):
             self.log_error(f"Failed to get review problems for {username}", e)
             raise
 
-    async def get_contribution_graph(self, username: str, year: int = 2025) -> List[Dict[str, Any]]:
+    async def get_contribution_graph(self, username: str, year: int = 2025, user_info: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """기여도 그래프 데이터"""
         try:
             cache_key = f"contribution_{username}_{year}"
@@ -287,7 +293,8 @@ class SolvedACService(LoggerMixin):
             contribution_data = generate_contribution_graph_data(year)
 
             # 실제 사용자의 해결한 문제 수를 바탕으로 일부 날짜에 데이터 추가
-            user_info = await self.get_user_info(username)
+            # 호출자가 이미 조회한 사용자 정보가 있으면 재사용
+            user_info = user_info or await self.get_user_info(username)
             solved_count = user_info.get("solved_count", 0)
 
             # 랜덤하게 일부 날짜에 문제 해결 데이터 배치
@@ -308,14 +315,15 @@ class SolvedACService(LoggerMixin):
             self.log_error(f"Failed to get contribution graph for {username}", e)
             raise
 
-    async def get_recent_activities(self, username: str, limit: int = 10) -> List[Dict[str, Any]]:
+    async def get_recent_activities(self, username: str, limit: int = 10, user_info: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """최근 활동 내역"""
         try:
             # 실제로는 solved.ac API에서 최근 제출 내역을 가져와야 하지만
             # 현재 API 제한으로 더미 데이터 생성
             activities = []
 
-            user_info = await self.get_user_info(username)
+            # 호출자가 이미 조회한 사용자 정보가 있으면 재사용
+            user_info = user_info or await self.get_user_info(username)
             solved_count = user_info.get("solved_count", 0)
 
             # 최근 활동 더미 데이터 생성
@@ -343,7 +351,7 @@ class SolvedACService(LoggerMixin):
             self.log_error(f"Failed to get recent activities for {username}", e)
             raise
 
-    async def get_weekly_stats(self, username: str) -> Dict[str, Any]:
+    async def get_weekly_stats(self, username: str, user_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """이번 주 통계"""
         try:
             cache_key = f"weekly_stats_{username}"
@@ -351,7 +359,8 @@ class SolvedACService(LoggerMixin):
             if cached_data:
                 return cached_data
 
-            user_info = await self.get_user_info(username)
+            # 호출자가 이미 조회한 사용자 정보가 있으면 재사용
+            user_info = user_info or await self.get_user_info(username)
 
             # 더미 데이터 생성 (실제로는 API에서 계산)
             stats = {
@@ -401,18 +410,28 @@ class SolvedACService(LoggerMixin):
             if cached_data:
                 return cached_data
 
-            start_time = datetime.now()
-            raw_data = await self.client.get_problem_info(problem_id)
-            problem_data = format_solved_ac_problem_data(raw_data)
-
-            # 캐시에 저장 (1시간)
-            self.cache.set_problem_info(problem_id, problem_data, ttl=3600)
-
-            duration = (datetime.now() - start_time).total_seconds()
-            self.log_performance("get_problem_info", duration, {"problem_id": problem_id})
+            task = _problem_info_inflight.get(problem_id)
+            if task is None:
+                task = asyncio.create_task(self._fetch_problem_info(problem_id))
+                _problem_info_inflight[problem_id] = task
+                task.add_done_callback(lambda _: _problem_info_inflight.pop(problem_id, None))
 
-            return problem_data
+            # 한 호출자가 취소되어도 다른 대기자를 위해 조회는 계속 진행
+            return await asyncio.shield(task)
 
         except Exception as e:
             self.log_error(f"Failed to get problem info for {problem_id}", e)
-            raise
\ No newline at end of file
+            raise
+
+    async def _fetch_problem_info(self, problem_id: int) -> Dict[str, Any]:
+        start_time = datetime.now()
+        raw_data = await self.client.get_problem_info(problem_id)
+        problem_data = format_solved_ac_problem_data(raw_data)
+
+        # 캐시에 저장 (문제 메타데이터는 거의 바뀌지 않으므로 24시간)
+        self.cache.set_problem_info(problem_id, problem_data, ttl=86400)
+
+        duration = (datetime.now() - start_time).total_seconds()
+        self.log_performance("get_problem_info", duration, {"problem_id": problem_id})
+
+        return problem_data
\ No newline at end of file
@@ -1,19 +1,31 @@
 from typing import Any, Optional, Dict, List
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import json
 import hashlib
+import re
+import orjson
 
 
-class InMemoryCache:
-    """간단한 인메모리 캐시 구현"""
+_INLINE_WHITESPACE_RE = re.compile(r"[ \t]+")
+
 
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
+class InMemoryCache:
+    """
+    간단한 인메모리 캐시 구현
+    - 항목별 TTL 만료
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._stats = {
             "hits": 0,
             "misses": 0,
             "sets": 0,
-            "deletes": 0
+            "deletes": 0,
+            "evictions": 0
         }
 
     def _is_expired(self, entry: Dict[str, Any]) -> bool:
@@ -34,6 +46,7 @@ class InMemoryCache:
             self._stats["misses"] += 1
             return None
 
+        self._cache.move_to_end(key)
         self._stats["hits"] += 1
         return entry["value"]
 
@@ -47,8 +60,13 @@ class InMemoryCache:
             "expires_at": expires_at,
             "ttl_seconds": ttl_seconds
         }
+        self._cache.move_to_end(key)
         self._stats["sets"] += 1
 
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self._stats["evictions"] += 1
+
     def delete(self, key: str) -> bool:
         """캐시에서 키를 삭제"""
         if key in self._cache:
@@ -57,6 +75,14 @@ class InMemoryCache:
             return True
         return False
 
+    def delete_prefix(self, prefix: str) -> int:
+        """접두사가 일치하는 모든 키를 삭제"""
+        keys = [key for key in self._cache if key.startswith(prefix)]
+        for key in keys:
+            del self._cache[key]
+        self._stats["deletes"] += len(keys)
+        return len(keys)
+
     def clear(self) -> None:
         """모든 캐시 항목 삭제"""
         self._cache.clear()
@@ -71,7 +97,8 @@ class InMemoryCache:
             "total_requests": total_requests,
             "hit_rate": round(hit_rate, 2),
             "cache_size": len(self._cache),
-            "memory_usage_mb": len(json.dumps(self._cache, default=str)) / (1024 * 1024)
+            # 한글 결과를 \uXXXX로 이스케이프하지 않는 orjson으로 실제 UTF-8 크기에 가깝게 추정
+            "memory_usage_mb": len(orjson.dumps(self._cache, default=str, option=orjson.OPT_NON_STR_KEYS)) / (1024 * 1024)
         }
 
     def cleanup_expired(self) -> int:
@@ -101,6 +128,11 @@ def cache_set(key: str, value: Any, expire: int = 300) -> None:
     cache.set(key, value, expire)
 
 
+def cache_delete_prefix(prefix: str) -> int:
+    """전역 캐시에서 접두사가 일치하는 키 삭제하기"""
+    return cache.delete_prefix(prefix)
+
+
 def cache_key_for_user(username: str, operation: str) -> str:
     """사용자 관련 캐시 키 생성"""
     return f"user:{username}:{operation}"
@@ -117,19 +149,103 @@ def cache_key_for_analysis(code_hash: str, problem_id: int) -> str:
 
 
 def generate_code_hash(code: str) -> str:
-    """코드 해시 생성"""
-    return hashlib.md5(code.encode('utf-8')).hexdigest()
+    """코드 해시 생성 (프로세스/워커 간에 동일한 값을 보장하는 내용 기반 해시)"""
+    return hashlib.blake2b(code.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _open_string_at_end(line: str, open_quote: Optional[str], comment_prefix: str) -> Optional[str]:
+    """줄 끝에서 아직 닫히지 않은 여러 줄 문자열의 구분자 반환 (삼중 따옴표 또는 백틱, 없으면 None)"""
+    i = 0
+    while i < len(line):
+        if open_quote:
+            end = line.find(open_quote, i)
+            if end < 0:
+                return open_quote
+            i = end + len(open_quote)
+            open_quote = None
+            continue
+
+        if line.startswith(comment_prefix, i):
+            # 나머지는 주석
+            return None
+        if line.startswith(('"""', "'''"), i):
+            open_quote = line[i:i + 3]
+            i += 3
+        elif line[i] == "`":
+            open_quote = "`"
+            i += 1
+        elif line[i] in "\"'":
+            # 한 줄 문자열은 같은 줄에서 닫힘 (이스케이프 건너뜀)
+            quote = line[i]
+            i += 1
+            while i < len(line) and line[i] != quote:
+                i += 2 if line[i] == "\\" else 1
+            i += 1
+        else:
+            i += 1
+    return open_quote
+
+
+def normalize_code(code: str, language: Optional[str] = None) -> str:
+    """
+    캐시 키용 코드 정규화 (빈 줄, 줄 단위 주석, 줄 내부 공백 차이 무시)
+    - 문자열 리터럴이 있는 줄과 여러 줄 문자열 안의 줄은 동작이 달라질 수 있으므로 그대로 유지
+    """
+    # 줄 중간 주석은 문자열 리터럴과 구분이 어려우므로 줄 전체 주석만 제거
+    comment_prefix = "#" if language and language.lower().startswith("python") else "//"
+    lines = []
+    open_quote = None
+    for line in code.splitlines():
+        if open_quote:
+            lines.append(line)
+            open_quote = _open_string_at_end(line, open_quote, comment_prefix)
+            continue
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith(comment_prefix):
+            continue
+
+        open_quote = _open_string_at_end(line, None, comment_prefix)
+        if any(quote in stripped for quote in ("\"", "'", "`")):
+            lines.append(line)
+            continue
+
+        # 들여쓰기는 Python 블록 구조에 영향을 주므로 유지
+        indent = line[:len(line) - len(line.lstrip())]
+        lines.append(indent + _INLINE_WHITESPACE_RE.sub(" ", stripped))
+    return "\n".join(lines)
 
 
 def cache_key_for_recommendations(username: str, mode: str, filters: Dict[str, Any]) -> str:
     """문제 추천 관련 캐시 키 생성"""
-    filter_hash = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    filter_hash = hashlib.blake2b(json.dumps(filters, sort_keys=True).encode(), digest_size=16).hexdigest()
     return f"recommendations:{username}:{mode}:{filter_hash}"
 
 
 class CacheManager:
     """캐시 관리자"""
 
+    @staticmethod
+    def get(key: str) -> Optional[Any]:
+        """임의 키의 캐시 값 조회"""
+        return cache.get(key)
+
+    @staticmethod
+    def set(key: str, value: Any, ttl: int = 300) -> None:
+        """임의 키에 캐시 값 저장"""
+        cache.set(key, value, ttl)
+
+    @staticmethod
+    def mget(keys: List[str]) -> List[Optional[Any]]:
+        """여러 키의 캐시 값을 한 번에 조회 (keys 순서대로, 없으면 None)"""
+        return [cache.get(key) for key in keys]
+
+    @staticmethod
+    def mset(items: Dict[str, Any], ttl: int = 300) -> None:
+        """여러 키에 같은 TTL로 캐시 값을 한 번에 저장"""
+        for key, value in items.items():
+            cache.set(key, value, ttl)
+
     @staticmethod
     def get_user_info(username: str) -> Optional[Dict[str, Any]]:
         """사용자 정보 캐시에서 가져오기"""
@@ -155,19 +271,28 @@ class CacheManager:
         cache.set(key, problem_info, ttl)
 
     @staticmethod
-    def get_code_analysis(code: str, problem_id: int) -> Optional[Dict[str, Any]]:
-        """코드 분석 결과 캐시에서 가져오기"""
-        code_hash = generate_code_hash(code)
+    def get_code_analysis(code: str, problem_id: int, language: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """코드 분석 결과 캐시에서 가져오기 (공백/주석만 다른 제출은 같은 결과 재사용)"""
+        code_hash = generate_code_hash(normalize_code(code, language))
         key = cache_key_for_analysis(code_hash, problem_id)
         return cache.get(key)
 
     @staticmethod
-    def set_code_analysis(code: str, problem_id: int, analysis: Dict[str, Any], ttl: int = 1800) -> None:
+    def set_code_analysis(code: str, problem_id: int, analysis: Dict[str, Any], ttl: int = 1800,
+                          language: Optional[str] = None) -> None:
         """코드 분석 결과 캐시에 저장"""
-        code_hash = generate_code_hash(code)
+        code_hash = generate_code_hash(normalize_code(code, language))
         key = cache_key_for_analysis(code_hash, problem_id)
         cache.set(key, analysis, ttl)
 
+    @staticmethod
+    def get_code_analyses(codes: List[str], problem_id: int, language: Optional[str] = None) -> List[Optional[Dict[str, Any]]]:
+        """여러 코드의 분석 결과를 한 번에 조회 (입력 순서대로, 없으면 None)"""
+        return [
+            cache.get(cache_key_for_analysis(generate_code_hash(normalize_code(code, language)), problem_id))
+            for code in codes
+        ]
+
     @staticmethod
     def get_recommendations(username: str, mode: str, filters: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """문제 추천 결과 캐시에서 가져오기"""
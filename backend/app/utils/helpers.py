@@ -3,33 +3,30 @@ from datetime import datetime, timedelta
 import calendar
 
 
+# 티어 ID(인덱스) -> 티어 이름 (고정된 목록이므로 모듈 로드 시 한 번만 생성)
+_TIER_NAMES = (
+    "Unrated",
+    "Bronze V", "Bronze IV", "Bronze III", "Bronze II", "Bronze I",
+    "Silver V", "Silver IV", "Silver III", "Silver II", "Silver I",
+    "Gold V", "Gold IV", "Gold III", "Gold II", "Gold I",
+    "Platinum V", "Platinum IV", "Platinum III", "Platinum II", "Platinum I",
+    "Diamond V", "Diamond IV", "Diamond III", "Diamond II", "Diamond I",
+    "Ruby V", "Ruby IV", "Ruby III", "Ruby II", "Ruby I",
+    "Master"
+)
+_TIER_IDS = {name: tier_id for tier_id, name in enumerate(_TIER_NAMES)}
+
+
 def tier_id_to_name(tier_id: int) -> str:
     """티어 ID를 티어 이름으로 변환"""
-    tier_names = {
-        0: "Unrated",
-        1: "Bronze V", 2: "Bronze IV", 3: "Bronze III", 4: "Bronze II", 5: "Bronze I",
-        6: "Silver V", 7: "Silver IV", 8: "Silver III", 9: "Silver II", 10: "Silver I",
-        11: "Gold V", 12: "Gold IV", 13: "Gold III", 14: "Gold II", 15: "Gold I",
-        16: "Platinum V", 17: "Platinum IV", 18: "Platinum III", 19: "Platinum II", 20: "Platinum I",
-        21: "Diamond V", 22: "Diamond IV", 23: "Diamond III", 24: "Diamond II", 25: "Diamond I",
-        26: "Ruby V", 27: "Ruby IV", 28: "Ruby III", 29: "Ruby II", 30: "Ruby I", 31: "Master"
-    }
-    return tier_names.get(tier_id, "Unknown")
+    if 0 <= tier_id < len(_TIER_NAMES):
+        return _TIER_NAMES[tier_id]
+    return "Unknown"
 
 
 def tier_name_to_id(tier_name: str) -> int:
     """티어 이름을 티어 ID로 변환"""
-    tier_map = {
-        "Unrated": 0,
-        "Bronze V": 1, "Bronze IV": 2, "Bronze III": 3, "Bronze II": 4, "Bronze I": 5,
-        "Silver V": 6, "Silver IV": 7, "Silver III": 8, "Silver II": 9, "Silver I": 10,
-        "Gold V": 11, "Gold IV": 12, "Gold III": 13, "Gold II": 14, "Gold I": 15,
-        "Platinum V": 16, "Platinum IV": 17, "Platinum III": 18, "Platinum II": 19, "Platinum I": 20,
-        "Diamond V": 21, "Diamond IV": 22, "Diamond III": 23, "Diamond II": 24, "Diamond I": 25,
-        "Ruby V": 26, "Ruby IV": 27, "Ruby III": 28, "Ruby II": 29, "Ruby I": 30,
-        "Master": 31
-    }
-    return tier_map.get(tier_name, 0)
+    return _TIER_IDS.get(tier_name, 0)
 
 
 def tier_id_to_color(tier_id: int) -> str:
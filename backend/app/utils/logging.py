@@ -116,8 +116,11 @@ class LoggerMixin:
         record.extra_fields = extra_fields
         self.logger.handle(record)
 
-    def log_error(self, message: str, error: Exception, context: Dict[str, Any] = None) -> None:
-        """에러 로그"""
+    def log_error(self, message: str, error: Exception, context: Dict[str, Any] = None, args: tuple = ()) -> None:
+        """에러 로그 (message는 args로 %-포맷팅, 핸들러가 출력할 때만 포맷팅)"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         extra_fields = {
             "error_type": type(error).__name__,
             "error_message": str(error),
@@ -130,7 +133,7 @@ class LoggerMixin:
             pathname="",
             lineno=0,
             msg=message,
-            args=(),
+            args=args,
             exc_info=(type(error), error, error.__traceback__)
         )
         record.extra_fields = extra_fields
@@ -157,7 +160,10 @@ class LoggerMixin:
         self.logger.handle(record)
 
     def log_performance(self, operation: str, duration: float, metadata: Dict[str, Any] = None) -> None:
-        """성능 로그"""
+        """성능 로그 (INFO 비활성 시 레코드 생성 생략)"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         extra_fields = {
             "operation": operation,
             "duration_ms": duration * 1000,
@@ -5,6 +5,7 @@ env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
 load_dotenv(env_path)
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 import logging
@@ -16,7 +17,8 @@ app = FastAPI(
     title=settings.app_name,
     description="Backend service for CAU Code platform with solved.ac integration and AI-powered features",
     version="1.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -52,6 +54,11 @@ async def startup_event():
         await background_task_queue.start()
         logger.info("백그라운드 작업 큐 시작됨")
 
+        # 활동 기록 일괄 저장기 시작
+        from app.core.activity_flusher import activity_flusher
+        await activity_flusher.start()
+        logger.info("활동 기록 일괄 저장기 시작됨")
+
         # 스케줄러 시작
         from app.core.scheduler import background_scheduler
         background_scheduler.start()
@@ -81,6 +88,19 @@ async def shutdown_event():
         await background_task_queue.stop()
         logger.info("백그라운드 작업 큐 종료됨")
 
+        # 남은 활동 기록 저장 후 일괄 저장기 종료
+        from app.core.activity_flusher import activity_flusher
+        await activity_flusher.stop()
+        logger.info("활동 기록 일괄 저장기 종료됨")
+
+        # 공유 OpenAI HTTP 연결 정리
+        from app.clients.openai_client import OpenAIClient
+        await OpenAIClient.close_shared_client()
+
+        # 공유 solved.ac HTTP 연결 정리
+        from app.clients.solvedac_client import SolvedACClient
+        await SolvedACClient.close_shared_client()
+
         logger.info("CAU Code 백엔드 서비스 종료 완료")
 
     except Exception as e:
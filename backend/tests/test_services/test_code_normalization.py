@@ -0,0 +1,51 @@
+from app.utils.cache import normalize_code
+
+
+def test_removes_full_line_python_comments():
+    code = "# 풀이\nx = 1\n    # 들여쓴 주석\ny = 2"
+    assert normalize_code(code, "python") == "x = 1\ny = 2"
+
+
+def test_removes_full_line_slash_comments():
+    code = "// 풀이\nint x = 1;\n    // 들여쓴 주석\nint y = 2;"
+    assert normalize_code(code, "cpp") == "int x = 1;\nint y = 2;"
+
+
+def test_keeps_hash_lines_for_non_python():
+    code = "#include <cstdio>\nint main() {}"
+    assert normalize_code(code, "cpp") == code
+
+
+def test_collapses_inline_whitespace_and_blank_lines():
+    code = "x  =\t1\n\n\ny   =  2"
+    assert normalize_code(code, "python") == "x = 1\ny = 2"
+
+
+def test_preserves_indentation():
+    code = "for i in range(3):\n    if i:\n        print(i  +  1)"
+    assert normalize_code(code, "python") == "for i in range(3):\n    if i:\n        print(i + 1)"
+
+
+def test_keeps_lines_with_string_literals_verbatim():
+    code = 'print("a   b")\nx  =  1'
+    assert normalize_code(code, "python") == 'print("a   b")\nx = 1'
+
+
+def test_keeps_triple_quoted_string_body_verbatim():
+    code = 's = """\n# 주석 아님\n\n  a   b\n"""\nx  =  1'
+    assert normalize_code(code, "python") == 's = """\n# 주석 아님\n\n  a   b\n"""\nx = 1'
+
+
+def test_keeps_backtick_string_body_verbatim():
+    code = "const s = `\n// 주석 아님\n  a   b\n`;\nlet  x  =  1;"
+    assert normalize_code(code, "javascript") == "const s = `\n// 주석 아님\n  a   b\n`;\nlet x = 1;"
+
+
+def test_quote_inside_trailing_comment_does_not_open_string():
+    code = "x = 1 # it's\ny  =  2"
+    assert normalize_code(code, "python") == "x = 1 # it's\ny = 2"
+
+
+def test_quote_inside_full_line_comment_is_removed():
+    code = "// it's\nint  x = 1;"
+    assert normalize_code(code, "cpp") == "int x = 1;"
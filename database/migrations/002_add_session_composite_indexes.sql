@@ -0,0 +1,12 @@
+-- Migration: Replace single-column session indexes with composite indexes
+-- 토큰 검증 / 사용자별 세션 조회 최적화
+
+-- 토큰 해시 + 만료 시각 복합 인덱스 (세션 검증 핫패스)
+CREATE INDEX IF NOT EXISTS ix_sessions_token_active ON user_sessions (access_token_hash, expires_at);
+
+-- 사용자별 최근 접근 세션 조회
+CREATE INDEX IF NOT EXISTS ix_sessions_user_recent ON user_sessions (user_id, last_accessed DESC);
+
+-- 복합 인덱스의 선두 컬럼과 중복되는 기존 단일 인덱스 제거
+DROP INDEX IF EXISTS idx_sessions_access_token;
+DROP INDEX IF EXISTS ix_user_sessions_access_token_hash;
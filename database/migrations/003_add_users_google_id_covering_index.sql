@@ -0,0 +1,8 @@
+-- Migration: Covering index for Google OAuth login lookups
+-- google_id 조회 시 로그인에 필요한 컬럼을 인덱스에서 바로 읽도록 INCLUDE
+
+CREATE INDEX IF NOT EXISTS ix_users_google_id_cover ON users (google_id)
+INCLUDE (email, name, profile_verified, solvedac_username, profile_image_url);
+
+-- 커버링 인덱스로 대체되는 기존 단일 인덱스 제거 (UNIQUE 제약은 유지)
+DROP INDEX IF EXISTS idx_users_google_id;
@@ -0,0 +1,10 @@
+-- Migration: Store solved.ac profile cache as JSONB with a jsonb_path_ops GIN index
+-- containment(@>) 전용 조회이므로 기본 jsonb_ops보다 작고 빠른 jsonb_path_ops 사용
+
+-- ORM(create_all)으로 생성된 DB는 JSON 타입이므로 JSONB로 변환
+ALTER TABLE users ALTER COLUMN solvedac_profile_data TYPE JSONB USING solvedac_profile_data::jsonb;
+
+CREATE INDEX IF NOT EXISTS ix_users_solvedac_profile_gin ON users USING GIN (solvedac_profile_data jsonb_path_ops);
+
+-- jsonb_ops 기반 기존 GIN 인덱스 제거
+DROP INDEX IF EXISTS idx_users_profile_data;
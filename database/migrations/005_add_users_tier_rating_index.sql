@@ -0,0 +1,4 @@
+-- Migration: Composite index for tier filtering with rating ordering
+-- solvedac_tier / solvedac_rating은 이미 비정규화된 컬럼이므로 JSONB 대신 스칼라 B-tree 사용
+
+CREATE INDEX IF NOT EXISTS ix_users_tier_rating ON users (solvedac_tier, solvedac_rating DESC);
@@ -0,0 +1,5 @@
+-- Migration: Partial index for pending verification code lookups
+-- UNIQUE 제약은 유지하고, 인증 확인 핫패스용으로 pending 행만 담는 작은 인덱스 추가
+
+CREATE INDEX IF NOT EXISTS ix_pv_pending_lookup ON profile_verification (verification_code)
+WHERE status = 'pending';
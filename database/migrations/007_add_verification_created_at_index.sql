@@ -0,0 +1,4 @@
+-- Migration: created_at index for verification record retention
+-- 보관 기간이 지난 인증 기록을 일일 작업에서 삭제할 때 범위 스캔으로 처리
+
+CREATE INDEX IF NOT EXISTS ix_pv_created_at ON profile_verification (created_at);
@@ -0,0 +1,21 @@
+-- Migration: Move solved.ac raw profile JSON out of users into user_solvedac_cache
+-- 인증/랭킹 등 자주 조회되는 users 행을 좁게 유지하기 위해 원본 프로필 데이터를 별도 테이블로 분리
+
+CREATE TABLE IF NOT EXISTS user_solvedac_cache (
+    user_id INTEGER PRIMARY KEY REFERENCES users(user_id) ON DELETE CASCADE,
+    profile_data JSONB NOT NULL,
+    last_synced TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_solvedac_cache_profile_gin ON user_solvedac_cache USING GIN (profile_data jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS ix_solvedac_cache_last_synced ON user_solvedac_cache (last_synced);
+
+-- 기존 캐시 데이터 이관
+INSERT INTO user_solvedac_cache (user_id, profile_data, last_synced)
+SELECT user_id, solvedac_profile_data, COALESCE(solvedac_last_synced, CURRENT_TIMESTAMP)
+FROM users
+WHERE solvedac_profile_data IS NOT NULL
+ON CONFLICT (user_id) DO NOTHING;
+
+-- 컬럼 삭제 시 ix_users_solvedac_profile_gin 인덱스도 함께 제거됨
+ALTER TABLE users DROP COLUMN IF EXISTS solvedac_profile_data;
@@ -0,0 +1,5 @@
+-- Migration: Index user_activities for per-user activity range scans
+-- 주간 통계의 사용자별 활동 범위 스캔을 인덱스로 처리
+-- 태그 GIN 인덱스는 014에서 제거되므로 여기서는 만들지 않음 (014_drop_unused_activity_tags_index.sql 참고)
+
+CREATE INDEX IF NOT EXISTS idx_user_activity_time ON user_activities (username, activity_type, created_at DESC);
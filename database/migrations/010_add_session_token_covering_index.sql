@@ -0,0 +1,7 @@
+-- Migration: Cover user_id in the session token lookup index
+-- 세션 검증 시 user_id까지 인덱스에서 읽도록 커버링 인덱스로 교체
+
+CREATE INDEX IF NOT EXISTS ix_sessions_token_cover ON user_sessions (access_token_hash, expires_at) INCLUDE (user_id);
+
+-- 커버링 인덱스와 키 컬럼이 같은 기존 복합 인덱스 제거
+DROP INDEX IF EXISTS ix_sessions_token_active;
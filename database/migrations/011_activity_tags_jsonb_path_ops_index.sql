@@ -0,0 +1,5 @@
+-- Migration: Rebuild the activity tag GIN index with jsonb_path_ops (no-op)
+-- 태그 GIN 인덱스는 014에서 제거되므로 더 이상 만들지 않음 (014_drop_unused_activity_tags_index.sql 참고)
+-- 이전 009로 이미 만들어진 기본 GIN 인덱스는 014에서 함께 제거
+
+SELECT 1;
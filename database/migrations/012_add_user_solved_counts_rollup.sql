@@ -0,0 +1,38 @@
+-- Migration: Maintain per-user CAU Code solved counts in a rollup table
+-- 랭킹 조회마다 user_activities 전체를 GROUP BY 하지 않도록 트리거로 해결 수를 누적
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS user_solved_counts (
+    username VARCHAR(50) PRIMARY KEY,
+    solved_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION update_user_solved_counts()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' AND NEW.activity_type = 'problem_solved' THEN
+        INSERT INTO user_solved_counts (username, solved_count) VALUES (NEW.username, 1)
+        ON CONFLICT (username) DO UPDATE SET solved_count = user_solved_counts.solved_count + 1;
+    ELSIF TG_OP = 'DELETE' AND OLD.activity_type = 'problem_solved' THEN
+        UPDATE user_solved_counts SET solved_count = solved_count - 1 WHERE username = OLD.username;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 트리거 생성 시 user_activities 쓰기가 잠기므로 아래 백필과 동시 삽입이 겹치지 않음
+DROP TRIGGER IF EXISTS trg_user_solved_counts ON user_activities;
+CREATE TRIGGER trg_user_solved_counts
+AFTER INSERT OR DELETE ON user_activities
+FOR EACH ROW EXECUTE FUNCTION update_user_solved_counts();
+
+-- 기존 활동 기록으로 초기값 채우기
+INSERT INTO user_solved_counts (username, solved_count)
+SELECT username, COUNT(*)
+FROM user_activities
+WHERE activity_type = 'problem_solved'
+GROUP BY username
+ON CONFLICT (username) DO UPDATE SET solved_count = EXCLUDED.solved_count;
+
+COMMIT;
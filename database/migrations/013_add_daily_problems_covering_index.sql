@@ -0,0 +1,5 @@
+-- Migration: Covering index for today's daily problem lookups
+-- 사용자+유형+날짜로 찾고 반환 컬럼까지 인덱스에서 읽도록 (index-only scan, Heap Fetches: 0)
+
+CREATE INDEX IF NOT EXISTS idx_daily_problems_cover ON daily_problems (username, problem_type, date DESC)
+INCLUDE (problem_id, problem_title, problem_tags, tier);
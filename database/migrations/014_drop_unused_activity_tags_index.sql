@@ -0,0 +1,6 @@
+-- Migration: Drop the activity tag GIN indexes
+-- 주간 통계가 사용자별 B-tree 범위 스캔 한 번으로 태그를 집계하게 되어 더 이상 조회에 쓰이지 않음 (쓰기 비용만 발생)
+-- 009/011은 이제 태그 인덱스를 만들지 않으며, 이전 버전으로 만들어진 인덱스를 여기서 정리
+
+DROP INDEX IF EXISTS idx_activity_tags_path_gin;
+DROP INDEX IF EXISTS idx_activity_tags_gin;
@@ -0,0 +1,4 @@
+-- Migration: Track profile sync claims on users
+-- 스케줄러가 동기화 대상을 UPDATE ... RETURNING 한 번으로 선점해서 중복 예약을 막기 위한 컬럼
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS sync_claimed_at TIMESTAMP WITH TIME ZONE;
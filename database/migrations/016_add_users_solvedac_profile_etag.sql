@@ -0,0 +1,4 @@
+-- Migration: Store the solved.ac profile ETag on users
+-- 프로필 동기화 시 If-None-Match로 조건부 요청을 보내 변경이 없으면(304) 본문 전송과 JSON 파싱을 생략하기 위한 컬럼
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS solvedac_profile_etag VARCHAR(255);
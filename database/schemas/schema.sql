@@ -22,15 +22,17 @@ CREATE TABLE IF NOT EXISTS users (
     solvedac_rating INTEGER,
     solvedac_solved_count INTEGER,
     solvedac_class INTEGER,
-    solvedac_profile_data JSONB,
     solvedac_last_synced TIMESTAMP WITH TIME ZONE,
+    sync_claimed_at TIMESTAMP WITH TIME ZONE, -- 동기화 작업 선점 시간 (중복 예약 방지)
+    solvedac_profile_etag VARCHAR(255), -- 마지막으로 받은 solved.ac 프로필 ETag (조건부 요청용)
 
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
 -- 사용자 테이블 인덱스
-CREATE INDEX IF NOT EXISTS idx_users_google_id ON users (google_id);
+CREATE INDEX IF NOT EXISTS ix_users_google_id_cover ON users (google_id)
+INCLUDE (email, name, profile_verified, solvedac_username, profile_image_url);
 CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
 CREATE INDEX IF NOT EXISTS idx_users_solvedac_username ON users (solvedac_username);
 CREATE INDEX IF NOT EXISTS idx_users_verified ON users (profile_verified);
@@ -38,8 +40,8 @@ CREATE INDEX IF NOT EXISTS idx_users_organization ON users (organization);
 
 -- solved.ac 프로필 데이터 인덱스 (Phase 2.2)
 CREATE INDEX IF NOT EXISTS idx_users_solvedac_tier ON users (solvedac_tier);
+CREATE INDEX IF NOT EXISTS ix_users_tier_rating ON users (solvedac_tier, solvedac_rating DESC);
 CREATE INDEX IF NOT EXISTS idx_users_solvedac_last_synced ON users (solvedac_last_synced);
-CREATE INDEX IF NOT EXISTS idx_users_profile_data ON users USING GIN (solvedac_profile_data);
 
 -- 랭킹 조회 최적화를 위한 복합 인덱스
 CREATE INDEX IF NOT EXISTS idx_users_verified_rating ON users (profile_verified, solvedac_rating DESC)
@@ -48,6 +50,16 @@ WHERE profile_verified = true AND solvedac_rating IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_users_org_verified_rating ON users (organization, profile_verified, solvedac_rating DESC)
 WHERE profile_verified = true AND solvedac_rating IS NOT NULL;
 
+-- 1-1. solved.ac 원본 프로필 캐시 테이블 (users 행을 좁게 유지하기 위해 분리)
+CREATE TABLE IF NOT EXISTS user_solvedac_cache (
+    user_id INTEGER PRIMARY KEY REFERENCES users(user_id) ON DELETE CASCADE,
+    profile_data JSONB NOT NULL,
+    last_synced TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_solvedac_cache_profile_gin ON user_solvedac_cache USING GIN (profile_data jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS ix_solvedac_cache_last_synced ON user_solvedac_cache (last_synced);
+
 -- 2. 사용자 세션 관리 테이블 (JWT)
 CREATE TABLE IF NOT EXISTS user_sessions (
     session_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -64,7 +76,8 @@ CREATE TABLE IF NOT EXISTS user_sessions (
 -- 세션 테이블 인덱스
 CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON user_sessions (user_id);
 CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON user_sessions (expires_at);
-CREATE INDEX IF NOT EXISTS idx_sessions_access_token ON user_sessions (access_token_hash);
+CREATE INDEX IF NOT EXISTS ix_sessions_token_cover ON user_sessions (access_token_hash, expires_at) INCLUDE (user_id);
+CREATE INDEX IF NOT EXISTS ix_sessions_user_recent ON user_sessions (user_id, last_accessed DESC);
 
 -- 3. solved.ac 프로필 인증 관리 테이블
 CREATE TABLE IF NOT EXISTS profile_verification (
@@ -84,9 +97,11 @@ CREATE TABLE IF NOT EXISTS profile_verification (
 -- 프로필 인증 테이블 인덱스
 CREATE INDEX IF NOT EXISTS idx_verification_user_id ON profile_verification (user_id);
 CREATE INDEX IF NOT EXISTS idx_verification_code ON profile_verification (verification_code);
+CREATE INDEX IF NOT EXISTS ix_pv_pending_lookup ON profile_verification (verification_code) WHERE status = 'pending';
 CREATE INDEX IF NOT EXISTS idx_verification_status ON profile_verification (status);
 CREATE INDEX IF NOT EXISTS idx_verification_expires_at ON profile_verification (expires_at);
 CREATE INDEX IF NOT EXISTS idx_verification_solvedac_username ON profile_verification (solvedac_username);
+CREATE INDEX IF NOT EXISTS ix_pv_created_at ON profile_verification (created_at);
 
 -- =============================================
 -- EXISTING TABLES (기존 테이블들)
@@ -108,6 +123,31 @@ CREATE TABLE IF NOT EXISTS user_activities (
 CREATE INDEX IF NOT EXISTS idx_username_created ON user_activities (username, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_activity_type ON user_activities (activity_type);
 CREATE INDEX IF NOT EXISTS idx_problem_id ON user_activities (problem_id);
+CREATE INDEX IF NOT EXISTS idx_user_activity_time ON user_activities (username, activity_type, created_at DESC);
+
+-- 사용자별 CAU Code 해결 수 집계 테이블 (랭킹 조회용, 트리거로 갱신)
+CREATE TABLE IF NOT EXISTS user_solved_counts (
+    username VARCHAR(50) PRIMARY KEY,
+    solved_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION update_user_solved_counts()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' AND NEW.activity_type = 'problem_solved' THEN
+        INSERT INTO user_solved_counts (username, solved_count) VALUES (NEW.username, 1)
+        ON CONFLICT (username) DO UPDATE SET solved_count = user_solved_counts.solved_count + 1;
+    ELSIF TG_OP = 'DELETE' AND OLD.activity_type = 'problem_solved' THEN
+        UPDATE user_solved_counts SET solved_count = solved_count - 1 WHERE username = OLD.username;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_user_solved_counts ON user_activities;
+CREATE TRIGGER trg_user_solved_counts
+AFTER INSERT OR DELETE ON user_activities
+FOR EACH ROW EXECUTE FUNCTION update_user_solved_counts();
 
 -- 2. 일별 추천 문제 테이블 (오늘의 문제 고정용)
 CREATE TABLE IF NOT EXISTS daily_problems (
@@ -125,6 +165,9 @@ CREATE TABLE IF NOT EXISTS daily_problems (
 -- 날짜+사용자+타입으로 유니크 제약
 CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_problems_unique ON daily_problems (date, username, problem_type, problem_id);
 CREATE INDEX IF NOT EXISTS idx_date_username_type ON daily_problems (date, username, problem_type);
+-- 오늘의 문제 조회를 index-only scan으로 처리하기 위한 커버링 인덱스
+CREATE INDEX IF NOT EXISTS idx_daily_problems_cover ON daily_problems (username, problem_type, date DESC)
+INCLUDE (problem_id, problem_title, problem_tags, tier);
 
 -- 3. solved.ac 문제 캐시 테이블 (API 호출 최적화)
 CREATE TABLE IF NOT EXISTS problem_cache (
@@ -15,8 +15,9 @@ const ContributionGraph = () => {
       setLoading(true);
       const response = await userService.getContribution();
 
-      if (response.status === 'success' && response.data?.daily_data) {
-        const dailyData = response.data.daily_data;
+      if (response.status === 'success' && response.data?.dates) {
+        const { dates, counts } = response.data;
+        const dailyData = dates.map((date, i) => ({ date, solved_count: counts[i] }));
         setTotalSolved(response.data.total_solved_this_year || 0);
 
         // 월별로 데이터 그룹화